@@ -83,6 +83,9 @@ with st.sidebar:
     # Allow programmatic page switching from Dashboard quick actions
     if "nav_target" in st.session_state:
         page = st.session_state.pop("nav_target")
+    # Race day sections queued in session_state are lost if never saved
+    if st.session_state.get("_rd_pending"):
+        st.warning("📝 Unsaved race day sections are queued — open Race Day Log to save them.")
     st.divider()
     if st.button("Logout", use_container_width=True):
         st.session_state.authenticated = False
@@ -92,14 +92,8 @@ def get_worksheet(sheet_key: str):
     return ws
 
 
-@st.cache_data(ttl=60, show_spinner=False)
-def _cached_read_sheet(sheet_key: str) -> pd.DataFrame:
-    """Cached read -- avoids repeated API calls within 60 seconds."""
-    ws = get_worksheet(sheet_key)
-    try:
-        all_values = _api_retry(ws.get_all_values)
-    except Exception:
-        return pd.DataFrame()
+def _frame_from_values(all_values: list) -> pd.DataFrame:
+    """Turn a header row + data rows (as returned by the Sheets API) into a DataFrame."""
     if not all_values or len(all_values) < 2:
         return pd.DataFrame()
     headers = all_values[0]
@@ -111,7 +105,8 @@ def _cached_read_sheet(sheet_key: str) -> pd.DataFrame:
     if num_cols == 0:
         return pd.DataFrame()
     headers = headers[:num_cols]
-    rows = [r[:num_cols] for r in all_values[1:]]
+    # Pad short rows -- values.batchGet drops trailing empty cells
+    rows = [(r + [""] * num_cols)[:num_cols] for r in all_values[1:]]
     # Filter out completely empty rows
     rows = [r for r in rows if any(cell.strip() for cell in r)]
     if not rows:
@@ -119,14 +114,44 @@ def _cached_read_sheet(sheet_key: str) -> pd.DataFrame:
     return pd.DataFrame(rows, columns=headers)
 
 
+@st.cache_data(ttl=60, max_entries=len(SHEETS), show_spinner=False)
+def _cached_read_sheet(sheet_key: str) -> pd.DataFrame:
+    """Cached read -- avoids repeated API calls within 60 seconds.
+    Bounded to one entry per known sheet tab."""
+    ws = get_worksheet(sheet_key)
+    try:
+        all_values = _api_retry(ws.get_all_values)
+    except Exception:
+        return pd.DataFrame()
+    return _frame_from_values(all_values)
+
+
+@st.cache_data(ttl=60, max_entries=8, show_spinner=False)
+def read_sheets(sheet_keys: tuple) -> dict:
+    """Read several sheet tabs in one values.batchGet round trip (cached 60s).
+    Returns {sheet_key: DataFrame}. Falls back to per-sheet reads if the
+    batch call fails (e.g. a tab does not exist yet)."""
+    ss = get_spreadsheet()
+    ranges = [f"'{SHEETS.get(k, k)}'" for k in sheet_keys]
+    try:
+        resp = _api_retry(ss.values_batch_get, ranges)
+    except Exception:
+        return {k: read_sheet(k) for k in sheet_keys}
+    value_ranges = resp.get("valueRanges", [])
+    return {k: _frame_from_values(vr.get("values", []))
+            for k, vr in zip(sheet_keys, value_ranges)}
+
+
 def read_sheet(sheet_key: str) -> pd.DataFrame:
     """Read all data from a sheet tab and return as DataFrame (cached 60s)."""
     return _cached_read_sheet(sheet_key)
 
 
 def _invalidate_read_cache():
-    """Clear the read cache after a write operation."""
+    """Clear the read caches after a write operation."""
     _cached_read_sheet.clear()
+    read_sheets.clear()
+    get_chassis_list.clear()
 
 
 def append_row(sheet_key: str, row_data: dict):
@@ -149,6 +174,31 @@ def append_row(sheet_key: str, row_data: dict):
     _invalidate_read_cache()
 
 
+def append_rows(sheet_key: str, rows: list):
+    """Append several rows (list of dicts) in a single API call.
+    Writes headers to row 1 from the first row if the sheet is empty."""
+    if not rows:
+        return
+    ws = get_worksheet(sheet_key)
+    existing_headers = _api_retry(ws.row_values, 1)
+    trimmed = [h for h in existing_headers if h.strip()]
+    if not trimmed:
+        trimmed = list(rows[0].keys())
+        _api_retry(ws.update, "A1", [trimmed])
+    values = [[str(r.get(h, "")) for h in trimmed] for r in rows]
+    _api_retry(ws.append_rows, values, value_input_option="USER_ENTERED")
+    _invalidate_read_cache()
+
+
+def append_row_values(sheet_key: str, values: list):
+    """Append one row given as values already in the sheet's column order.
+    Skips the header lookup append_row/append_rows do -- one API call."""
+    ws = get_worksheet(sheet_key)
+    _api_retry(ws.append_row, [str(v) for v in values],
+               value_input_option="USER_ENTERED")
+    _invalidate_read_cache()
+
+
 def update_row(sheet_key: str, row_index: int, row_data: dict):
     """Update a row at the given 1-based sheet row index."""
     ws = get_worksheet(sheet_key)
@@ -168,8 +218,9 @@ def delete_row(sheet_key: str, row_index: int):
     _invalidate_read_cache()
 
 
+@st.cache_data(ttl=300, show_spinner=False)
 def get_chassis_list() -> list:
-    """Return a list of chassis names from the chassis_profiles sheet."""
+    """Return a list of chassis names from the chassis_profiles sheet (cached 5 min)."""
     df = read_sheet("chassis")
     if df.empty:
         return []
@@ -251,7 +302,7 @@ def upsert_race_day(date_str: str, track: str, data: dict):
         # Create new row
         data["date"] = date_str
         data["track"] = track
-        append_row("race_day", data)
+        append_rows("race_day", [data])
         # Find the row we just created
         new_idx, _ = find_race_day(date_str, track)
         return new_idx
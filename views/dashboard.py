@@ -1,5 +1,5 @@
 import streamlit as st
-from utils.gsheet_db import read_sheet, get_chassis_list, find_race_day
+from utils.gsheet_db import read_sheets, get_chassis_list, find_race_day
 
 
 def _v(data, key, default=""):
@@ -167,8 +167,14 @@ def render():
     # ---- Quick stats row ----
     chassis_list = get_chassis_list()
 
+    # One batched round trip for the three stat sheets
     try:
-        tires_df = read_sheet("tires")
+        sheets = read_sheets(("tires", "maintenance", "race_day"))
+    except Exception:
+        sheets = {}
+
+    try:
+        tires_df = sheets["tires"]
         active_tires = len(tires_df[tires_df["status"].isin(["New", "Practice", "Delaware", "Series"])]) if not tires_df.empty and "status" in tires_df.columns else 0
         total_tires = len(tires_df) if not tires_df.empty else 0
     except Exception:
@@ -176,13 +182,13 @@ def render():
         total_tires = 0
 
     try:
-        maint_df = read_sheet("maintenance")
+        maint_df = sheets["maintenance"]
         open_tasks = len(maint_df[maint_df["status"].isin(["Open", "In Progress"])]) if not maint_df.empty and "status" in maint_df.columns else 0
     except Exception:
         open_tasks = 0
 
     try:
-        race_df = read_sheet("race_day")
+        race_df = sheets["race_day"]
         total_races = len(race_df) if not race_df.empty else 0
     except Exception:
         race_df = None
@@ -206,13 +212,11 @@ def render():
     st.subheader("\U0001f4cb Recent Race Day Logs")
     try:
         if race_df is not None and not race_df.empty:
-            df_display = race_df.iloc[::-1].reset_index(drop=True)
+            # Reverse only the four label columns, not the full ~100-column log
+            label_cols = (race_df.reindex(columns=["date", "track", "chassis", "feature_finish"])
+                          .iloc[::-1].fillna("").to_numpy())
             options = []
-            for _, row in df_display.iterrows():
-                date_val = row.get("date", "")
-                track_val = row.get("track", "")
-                chassis_val = row.get("chassis", "")
-                feat_val = row.get("feature_finish", "")
+            for date_val, track_val, chassis_val, feat_val in label_cols:
                 lbl = f"{date_val} | {track_val}"
                 if chassis_val:
                     lbl += f" | {chassis_val}"
@@ -220,9 +224,9 @@ def render():
                     lbl += f" | Finished: {feat_val}"
                 options.append(lbl)
 
-            selected = st.selectbox("Select a race day to view details", options, key="dash_log_select")
-            sel_idx = options.index(selected)
-            sel_row = df_display.iloc[sel_idx]
+            sel_idx = st.selectbox("Select a race day to view details", range(len(options)),
+                                   format_func=options.__getitem__, key="dash_log_select")
+            sel_row = race_df.iloc[len(race_df) - 1 - sel_idx]
             sel_date  = sel_row.get("date", "")
             sel_track = sel_row.get("track", "")
             _, full_data = find_race_day(sel_date, sel_track)
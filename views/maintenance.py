@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime, date
+from itertools import islice
 from utils.gsheet_db import read_sheet, append_row, update_row, timestamp_now
 from utils.auth import can_edit, can_delete
 
@@ -63,6 +64,16 @@ WEEKLY_CHECKLIST = {
     ],
 }
 
+# Flat (category, item) list plus precomputed progress fractions/labels
+_ALL_ITEMS = tuple(
+    (category, item) for category, items in WEEKLY_CHECKLIST.items() for item in items
+)
+_TOTAL_ITEMS = len(_ALL_ITEMS)
+_PROGRESS = tuple(
+    (i / _TOTAL_ITEMS, f"{i} / {_TOTAL_ITEMS} items checked")
+    for i in range(_TOTAL_ITEMS + 1)
+)
+
 
 def _render_weekly_checklist():
     """Render the Weekly Pro Late Model Maintenance Checklist tab."""
@@ -96,24 +107,13 @@ def _render_weekly_checklist():
     st.markdown("Check off each item as you complete your weekly maintenance. "
                 "Save the checklist when done to keep a dated record.")
 
-    # Load previous checklists
-    try:
-        history_df = read_sheet("weekly_checklist")
-    except Exception:
-        history_df = pd.DataFrame()
-
     st.markdown("---")
 
     # Date selection for this checklist
     checklist_date = st.date_input("Checklist Date", value=date.today(), key="wc_date")
 
-    # Build flat list of all items for tracking
-    all_items = []
-    for category, items in WEEKLY_CHECKLIST.items():
-        for item in items:
-            all_items.append((category, item))
-
-    total_items = len(all_items)
+    all_items = _ALL_ITEMS
+    total_items = _TOTAL_ITEMS
 
     # Checklist with checkboxes
     checked_items = []
@@ -128,8 +128,8 @@ def _render_weekly_checklist():
 
     # Progress bar
     done_count = len(checked_items)
-    progress = done_count / total_items if total_items > 0 else 0
-    st.progress(progress, text=f"{done_count} / {total_items} items checked")
+    progress, progress_label = _PROGRESS[done_count]
+    st.progress(progress, text=progress_label)
 
         # Notes section
     st.markdown("---")
@@ -149,6 +149,7 @@ def _render_weekly_checklist():
                 if done_count == 0:
                     st.warning("No items checked. Check off completed items before saving.")
                 else:
+                    checked_set = set(checked_items)
                     record = {
                         "timestamp": timestamp_now(),
                         "week_of": str(checklist_date),
@@ -158,14 +159,12 @@ def _render_weekly_checklist():
                     }
                     for category, items in WEEKLY_CHECKLIST.items():
                         cat_key = category.split(". ", 1)[1] if ". " in category else category
-                        cat_checked = [i for i in items if i in checked_items]
+                        cat_checked = [i for i in items if i in checked_set]
                         record[cat_key] = f"{len(cat_checked)}/{len(items)}"
 
-                    unchecked = [item for _, item in all_items if item not in checked_items]
-                    if unchecked:
-                        record["skipped_items"] = "; ".join(unchecked[:10])
-                    else:
-                        record["skipped_items"] = ""
+                    # Only the first 10 skipped items are recorded
+                    unchecked = (item for _, item in all_items if item not in checked_set)
+                    record["skipped_items"] = "; ".join(islice(unchecked, 10))
                     record["notes"] = checklist_notes
 
                     append_row("weekly_checklist", record)
@@ -192,6 +191,11 @@ def _render_weekly_checklist():
     # Checklist History
     st.markdown("---")
     st.subheader("Checklist History")
+    # Loaded after the save logic so a fresh save shows up immediately
+    try:
+        history_df = read_sheet("weekly_checklist")
+    except Exception:
+        history_df = pd.DataFrame()
     if history_df.empty:
         st.info("No checklists saved yet. Complete your first weekly check above!")
     else:
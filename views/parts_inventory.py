@@ -72,7 +72,8 @@ def render():
                     c_yes, c_no = st.columns(2)
                     with c_yes:
                         if st.button("✅ Yes, Delete", type="primary", key="confirm_del_part_yes"):
-                            row_idx = df[df["part_name"] == del_name].index[0] + 2
+                            # Position of the first match in one vectorized compare; +2 for header and 1-basing
+                            row_idx = int((df["part_name"] == del_name).to_numpy().argmax()) + 2
                             delete_row("parts", row_idx)
                             st.session_state.pop("confirm_delete_part", None)
                             st.success(f"Deleted {del_name}")
@@ -1,28 +1,42 @@
 import streamlit as st
+import numpy as np
+import pandas as pd
 from utils.gsheet_db import (
     read_sheet, get_chassis_list, timestamp_now,
     find_race_day, upsert_race_day, ensure_race_day_headers, delete_row,
 )
 from utils.auth import can_edit, can_delete
 
-# -- All column headers the race_day sheet needs --
-ALL_HEADERS = [
+CREATED_KEY = "created"
+_SESSIONS = ["p1", "p2", "heat", "feat"]
+_CORNERS  = ["LF", "RF", "LR", "RR"]
+
+# Per-session sheet keys, built once: setup is field-major (tire/pres/spring/bump
+# x LF/RF/LR/RR), temps is corner-major (LF/RF/LR/RR x in/mid/out)
+_SESSION_KEYS = {
+    s: {
+        "setup": tuple(f"{s}_{field}_{c.lower()}" for field in ("tire", "pres", "spring", "bump") for c in _CORNERS),
+        "temps": tuple(f"{s}_temp_{c}_{zone}" for c in _CORNERS for zone in ("in", "mid", "out")),
+    }
+    for s in _SESSIONS
+}
+
+# -- All column headers the race_day sheet needs (built once at import) --
+ALL_HEADERS = (
     "date", "track", "chassis", "weather", "track_condition", "air_temp",
     "practice", "practice2", "qualifying", "heat_race", "feature",
     "qual_position", "heat_finish", "feature_finish",
-    "adjustments", "notes", "created",
-]
-_SESSIONS = ["p1", "p2", "heat", "feat"]
-_CORNERS  = ["LF", "RF", "LR", "RR"]
-for s in _SESSIONS:
-    for field in ["tire", "pres", "spring", "bump"]:
-        for c in _CORNERS:
-            ALL_HEADERS.append(f"{s}_{field}_{c.lower()}")
-    ALL_HEADERS.append(f"{s}_stagger_f")
-    ALL_HEADERS.append(f"{s}_stagger_r")
-    for c in _CORNERS:
-        for zone in ["in", "mid", "out"]:
-            ALL_HEADERS.append(f"{s}_temp_{c}_{zone}")
+    "adjustments", "notes", CREATED_KEY,
+    *(
+        h
+        for s in _SESSIONS
+        for h in (*_SESSION_KEYS[s]["setup"], f"{s}_stagger_f", f"{s}_stagger_r", *_SESSION_KEYS[s]["temps"])
+    ),
+)
+
+_TRACK_CONDITIONS = ("Dry", "Damp", "Wet", "Dusty", "Tacky")
+_TRACK_CONDITION_IDX = {v: i for i, v in enumerate(_TRACK_CONDITIONS)}
+DEFAULT_TRACKS = ("Sauble Speedway", "Flamboro Speedway", "Delaware Speedway", "Sunset Speedway", "Peterborough Speedway", "Jukasa Motor Speedway")
 
 _SESSION_MAP = {
     "p1":   ("Practice #1", "practice"),
@@ -38,12 +52,90 @@ def _v(data, key, default=""):
 
 def _vf(data, key, default=0.0):
     """Get a float value from a dict."""
-    val = data.get(key, "")
+    val = data.get(key)
+    if isinstance(val, (int, float)):
+        return float(val)
+    if not val:
+        return default
     try:
         return float(val)
     except (ValueError, TypeError):
         return default
 
+@st.cache_resource(show_spinner=False)
+def _ensure_headers_once():
+    """Headers never change at runtime -- check the sheet once per server process."""
+    ensure_race_day_headers(ALL_HEADERS)
+    return True
+
+@st.cache_data(ttl="30s", max_entries=32, show_spinner=False)
+def _cached_find_race_day(date_str, track):
+    """find_race_day() memoized per (date, track) so form reruns skip the sheet scan."""
+    return find_race_day(date_str, track)
+
+@st.cache_data(ttl="60s", show_spinner=False)
+def _race_day_newest_first():
+    """race_day rows newest first -- reversed once per cache window, not per rerun."""
+    df = read_sheet("race_day")
+    return df.iloc[::-1].reset_index(drop=True) if not df.empty else df
+
+def _clear_race_day_caches():
+    """Drop the view-level race_day caches after a write."""
+    _cached_find_race_day.clear()
+    _race_day_newest_first.clear()
+
+def _save_race_day(date_str, track, save):
+    """Upsert a race day row and drop the cached lookups it invalidates."""
+    upsert_race_day(date_str, track, save)
+    _clear_race_day_caches()
+
+def _stage_race_day(date_str, track, section, save):
+    """Queue one section's values; Save All Pending writes them in a single upsert."""
+    pending = st.session_state.setdefault("_rd_pending", {})
+    entry = pending.setdefault((date_str, track), {"sections": [], "data": {}})
+    if section not in entry["sections"]:
+        entry["sections"].append(section)
+    entry["data"].update(save)
+
+def _pending_bar():
+    """Show every queued race day with Save All / Discard buttons.
+    Lists all (date, track) keys, not just the selected one, so switching
+    the date or track never hides unsaved sections."""
+    pending = st.session_state.get("_rd_pending", {})
+    if not pending:
+        return
+    st.warning("\U0001f4dd Pending (not yet saved):\n" + "\n".join(
+        f"- {d} \u2014 {t}: {', '.join(e['sections'])}" for (d, t), e in pending.items()))
+    pc1, pc2 = st.columns(2)
+    with pc1:
+        if st.button("\U0001f4be Save All Pending", type="primary", use_container_width=True, key="rd_save_pending"):
+            created = timestamp_now()  # one timestamp for the whole batch
+            # One upsert per race day; pop each as it lands so a failure keeps the rest queued
+            for key in list(pending):
+                save = pending[key]["data"]
+                save[CREATED_KEY] = created
+                _save_race_day(*key, save)
+                pending.pop(key)
+            st.success("Race day saved!")
+            st.rerun()
+    with pc2:
+        if st.button("Discard Pending", use_container_width=True, key="rd_discard_pending"):
+            pending.clear()
+            st.rerun()
+
+# Camber verdicts (icon, status, advice), indexed by the codes from _camber_analysis()
+_CAMBER_VERDICTS = (
+    ("\u26a0\ufe0f", "Not enough negative camber", "Add negative camber or increase roll resistance on this corner."),
+    ("\u2705", "Camber OK", "Camber close; adjust only for fine balance."),
+    ("\u26a0\ufe0f", "Too much negative camber", "Reduce negative camber on this corner."),
+)
+
+def _camber_analysis(inner, outer):
+    """Inner-minus-outer temp deltas and a _CAMBER_VERDICTS index per corner."""
+    deltas = np.asarray(inner, dtype=float) - np.asarray(outer, dtype=float)
+    status = np.select([deltas < -10, deltas > 10], [0, 2], default=1)
+    return deltas, status
+
 
 # ── Read-only detail view for a selected race day ──
 def _show_detail(data):
@@ -64,9 +156,14 @@ def _show_detail(data):
     r3.metric("🏆 Feature Finish", _v(data, 'feature_finish', '—'))
     st.divider()
 
+    # Camber for every session in one pass: temps is (session, corner, in/mid/out)
+    temps = np.array([[_vf(data, k) for k in _SESSION_KEYS[p]["temps"]] for p in _SESSION_MAP])
+    temps = temps.reshape(len(_SESSION_MAP), len(_CORNERS), 3)
+    deltas, statuses = _camber_analysis(temps[:, :, 0], temps[:, :, 2])
+
     # Session detail blocks
-    for prefix, (label, notes_key) in _SESSION_MAP.items():
-        _show_session_detail(prefix, label, notes_key, data)
+    for i, (prefix, (label, notes_key)) in enumerate(_SESSION_MAP.items()):
+        _show_session_detail(prefix, label, notes_key, data, (temps[i], deltas[i], statuses[i]))
 
     # Qualifying notes (no tire data)
     qual_notes = _v(data, 'qualifying')
@@ -87,99 +184,72 @@ def _show_detail(data):
                 st.write(gen)
 
 
-def _show_session_detail(prefix, label, notes_key, data):
-    """Show one session's tires, springs, temps & notes in an expander."""
-    # Check if session has any data at all
-    has_data = False
-    for field in ["tire", "pres", "spring", "bump"]:
-        for c in ["lf", "rf", "lr", "rr"]:
-            if _v(data, f"{prefix}_{field}_{c}"):
-                has_data = True
-                break
-        if has_data:
-            break
-    if not has_data:
-        if _v(data, notes_key):
-            has_data = True
-    if not has_data:
-        for c in _CORNERS:
-            for z in ["in", "mid", "out"]:
-                if _v(data, f"{prefix}_temp_{c}_{z}"):
-                    has_data = True
-                    break
-            if has_data:
-                break
-    if not has_data:
+def _show_session_detail(prefix, label, notes_key, data, camber):
+    """Show one session's tires, springs, temps & notes in an expander.
+    camber is this session's (temps, deltas, statuses) slice from _show_detail."""
+    # Skip sessions with nothing saved -- any() stops at the first filled key
+    keys = _SESSION_KEYS[prefix]
+    if not any(data.get(k) for k in keys["setup"] + (notes_key,) + keys["temps"]):
         return
 
+    # This session's fields with the "{prefix}_" stripped, built once
+    pfx = f"{prefix}_"
+    local = {k[len(pfx):]: v for k, v in data.items() if k.startswith(pfx)}
+
     with st.expander(f"🏎️ {label}", expanded=True):
         # Tire sizes row
         sz1, sz2, sz3, sz4 = st.columns(4)
-        sz1.metric("🟦 LF Tire", _v(data, f"{prefix}_tire_lf", "—"))
-        sz2.metric("🟥 RF Tire", _v(data, f"{prefix}_tire_rf", "—"))
-        sz3.metric("🟦 LR Tire", _v(data, f"{prefix}_tire_lr", "—"))
-        sz4.metric("🟥 RR Tire", _v(data, f"{prefix}_tire_rr", "—"))
+        sz1.metric("🟦 LF Tire", _v(local, "tire_lf", "—"))
+        sz2.metric("🟥 RF Tire", _v(local, "tire_rf", "—"))
+        sz3.metric("🟦 LR Tire", _v(local, "tire_lr", "—"))
+        sz4.metric("🟥 RR Tire", _v(local, "tire_rr", "—"))
 
         # Stagger
         sg1, sg2 = st.columns(2)
-        sg1.metric("Stagger Front", _v(data, f"{prefix}_stagger_f", "—"))
-        sg2.metric("Stagger Rear", _v(data, f"{prefix}_stagger_r", "—"))
+        sg1.metric("Stagger Front", _v(local, "stagger_f", "—"))
+        sg2.metric("Stagger Rear", _v(local, "stagger_r", "—"))
 
         # Pressure / Spring / Bump  (two rows: front then rear)
         st.markdown("**Front Corners**")
         f1, f2 = st.columns(2)
         with f1:
             st.caption("🟦 LF")
-            st.markdown(f"Pressure: **{_v(data, f'{prefix}_pres_lf', '—')}** | "
-                        f"Spring: **{_v(data, f'{prefix}_spring_lf', '—')}** | "
-                        f"Bump: **{_v(data, f'{prefix}_bump_lf', '—')}**")
+            st.markdown(f"Pressure: **{_v(local, 'pres_lf', '—')}** | "
+                        f"Spring: **{_v(local, 'spring_lf', '—')}** | "
+                        f"Bump: **{_v(local, 'bump_lf', '—')}**")
         with f2:
             st.caption("🟥 RF")
-            st.markdown(f"Pressure: **{_v(data, f'{prefix}_pres_rf', '—')}** | "
-                        f"Spring: **{_v(data, f'{prefix}_spring_rf', '—')}** | "
-                        f"Bump: **{_v(data, f'{prefix}_bump_rf', '—')}**")
+            st.markdown(f"Pressure: **{_v(local, 'pres_rf', '—')}** | "
+                        f"Spring: **{_v(local, 'spring_rf', '—')}** | "
+                        f"Bump: **{_v(local, 'bump_rf', '—')}**")
 
         st.markdown("**Rear Corners**")
         r1, r2 = st.columns(2)
         with r1:
             st.caption("🟦 LR")
-            st.markdown(f"Pressure: **{_v(data, f'{prefix}_pres_lr', '—')}** | "
-                        f"Spring: **{_v(data, f'{prefix}_spring_lr', '—')}** | "
-                        f"Bump: **{_v(data, f'{prefix}_bump_lr', '—')}**")
+            st.markdown(f"Pressure: **{_v(local, 'pres_lr', '—')}** | "
+                        f"Spring: **{_v(local, 'spring_lr', '—')}** | "
+                        f"Bump: **{_v(local, 'bump_lr', '—')}**")
         with r2:
             st.caption("🟥 RR")
-            st.markdown(f"Pressure: **{_v(data, f'{prefix}_pres_rr', '—')}** | "
-                        f"Spring: **{_v(data, f'{prefix}_spring_rr', '—')}** | "
-                        f"Bump: **{_v(data, f'{prefix}_bump_rr', '—')}**")
+            st.markdown(f"Pressure: **{_v(local, 'pres_rr', '—')}** | "
+                        f"Spring: **{_v(local, 'spring_rr', '—')}** | "
+                        f"Bump: **{_v(local, 'bump_rr', '—')}**")
 
         # Tire temps
-        has_temps = False
-        for c in _CORNERS:
-            for z in ["in", "mid", "out"]:
-                val = _v(data, f"{prefix}_temp_{c}_{z}")
-                if val and val not in ("0", "0.0", "0.00"):
-                    has_temps = True
-                    break
-            if has_temps:
-                break
+        temp_keys = _SESSION_KEYS[prefix]["temps"]
+        has_temps = any(_v(data, k) not in ("", "0", "0.0", "0.00") for k in temp_keys)
         if has_temps:
             st.markdown("🌡️ **Tire Temps**")
-            for c in _CORNERS:
-                t_in  = _vf(data, f"{prefix}_temp_{c}_in")
-                t_mid = _vf(data, f"{prefix}_temp_{c}_mid")
-                t_out = _vf(data, f"{prefix}_temp_{c}_out")
+            temps, deltas, statuses = camber
+            for i, c in enumerate(_CORNERS):
+                t_in, t_mid, t_out = temps[i].tolist()
                 if t_in == 0 and t_mid == 0 and t_out == 0:
                     continue
-                delta = t_in - t_out
-                if delta > 10:
-                    icon, status = "⚠️", "Too much negative camber"
-                elif delta < -10:
-                    icon, status = "⚠️", "Not enough negative camber"
-                else:
-                    icon, status = "✅", "Camber OK"
+                icon, status, _ = _CAMBER_VERDICTS[statuses[i]]
                 tc1, tc2 = st.columns([1, 3])
                 with tc1:
-                    st.metric(f"{c} Delta", f"{delta:+.1f}°")
+                    st.metric(f"{c} Delta", f"{deltas[i]:+.1f}°")
                 with tc2:
                     st.markdown(f"{icon} **{status}**")
                     st.caption(f"Inner: {t_in}° | Mid: {t_mid}° | Outer: {t_out}°")
@@ -192,120 +262,85 @@ def _show_session_detail(prefix, label, notes_key, data):
 
 
 # -- Editable form helpers (used in Race Day Entry tab) --
+_SETUP_COLUMNS = ("Tire Size", "Air Pressure", "Spring Rate (lbs)", "Bump Spring (lbs)")
+_TEMP_COLUMNS  = ("Inner", "Middle", "Outer")
+
+
 def tire_block(prefix, label, data):
-    """Tire size, stagger, air pressure, spring/bump inside a form."""
+    """Tire size, stagger, air pressure, spring/bump inside a form.
+    The 16 per-corner values live in one 4x4 data_editor grid (rows LF/RF/LR/RR)."""
     st.markdown(f"**{label}**")
-    sz1, sz2, sz3, sz4 = st.columns(4)
-    with sz1:
-        st.markdown("**🟦 LF**")
-        lf_sz = st.text_input("Tire Size", value=_v(data, f"{prefix}_tire_lf"), key=f"{prefix}_tire_lf")
-    with sz2:
-        st.markdown("**🟥 RF**")
-        rf_sz = st.text_input("Tire Size", value=_v(data, f"{prefix}_tire_rf"), key=f"{prefix}_tire_rf")
-    with sz3:
-        st.markdown("**🟦 LR**")
-        lr_sz = st.text_input("Tire Size", value=_v(data, f"{prefix}_tire_lr"), key=f"{prefix}_tire_lr")
-    with sz4:
-        st.markdown("**🟥 RR**")
-        rr_sz = st.text_input("Tire Size", value=_v(data, f"{prefix}_tire_rr"), key=f"{prefix}_tire_rr")
+    keys = _SESSION_KEYS[prefix]["setup"]
+    grid = pd.DataFrame(
+        np.array([_v(data, k) for k in keys], dtype=object).reshape(len(_SETUP_COLUMNS), len(_CORNERS)).T,
+        index=_CORNERS, columns=_SETUP_COLUMNS,
+    )
+    edited = st.data_editor(
+        grid, num_rows="fixed", use_container_width=True, key=f"{prefix}_setup",
+        # Text columns, like the old text inputs -- "14.5 psi" and "450" round-trip untouched
+        column_config={c: st.column_config.TextColumn(c) for c in _SETUP_COLUMNS},
+    )
     sg1, sg2 = st.columns(2)
     with sg1:
         stg_f = st.text_input("Stagger Front (RF − LF)", value=_v(data, f"{prefix}_stagger_f"), key=f"{prefix}_stagger_f")
     with sg2:
         stg_r = st.text_input("Stagger Rear (RR − LR)", value=_v(data, f"{prefix}_stagger_r"), key=f"{prefix}_stagger_r")
-    st.markdown("**Front Corners**")
-    sf1, sf2 = st.columns(2)
-    with sf1:
-        st.markdown("*🟦 LF*")
-        lf_pr = st.text_input("Air Pressure", value=_v(data, f"{prefix}_pres_lf"), key=f"{prefix}_pres_lf")
-        lf_sp = st.text_input("Spring Rate (lbs)", value=_v(data, f"{prefix}_spring_lf"), key=f"{prefix}_spring_lf")
-        lf_bu = st.text_input("Bump Spring (lbs)", value=_v(data, f"{prefix}_bump_lf"), key=f"{prefix}_bump_lf")
-    with sf2:
-        st.markdown("*🟥 RF*")
-        rf_pr = st.text_input("Air Pressure", value=_v(data, f"{prefix}_pres_rf"), key=f"{prefix}_pres_rf")
-        rf_sp = st.text_input("Spring Rate (lbs)", value=_v(data, f"{prefix}_spring_rf"), key=f"{prefix}_spring_rf")
-        rf_bu = st.text_input("Bump Spring (lbs)", value=_v(data, f"{prefix}_bump_rf"), key=f"{prefix}_bump_rf")
-    st.markdown("**Rear Corners**")
-    sr1, sr2 = st.columns(2)
-    with sr1:
-        st.markdown("*🟦 LR*")
-        lr_pr = st.text_input("Air Pressure", value=_v(data, f"{prefix}_pres_lr"), key=f"{prefix}_pres_lr")
-        lr_sp = st.text_input("Spring Rate (lbs)", value=_v(data, f"{prefix}_spring_lr"), key=f"{prefix}_spring_lr")
-        lr_bu = st.text_input("Bump Spring (lbs)", value=_v(data, f"{prefix}_bump_lr"), key=f"{prefix}_bump_lr")
-    with sr2:
-        st.markdown("*🟥 RR*")
-        rr_pr = st.text_input("Air Pressure", value=_v(data, f"{prefix}_pres_rr"), key=f"{prefix}_pres_rr")
-        rr_sp = st.text_input("Spring Rate (lbs)", value=_v(data, f"{prefix}_spring_rr"), key=f"{prefix}_spring_rr")
-        rr_bu = st.text_input("Bump Spring (lbs)", value=_v(data, f"{prefix}_bump_rr"), key=f"{prefix}_bump_rr")
-    return {
-        f"{prefix}_tire_lf": lf_sz, f"{prefix}_pres_lf": lf_pr, f"{prefix}_spring_lf": lf_sp, f"{prefix}_bump_lf": lf_bu,
-        f"{prefix}_tire_rf": rf_sz, f"{prefix}_pres_rf": rf_pr, f"{prefix}_spring_rf": rf_sp, f"{prefix}_bump_rf": rf_bu,
-        f"{prefix}_tire_lr": lr_sz, f"{prefix}_pres_lr": lr_pr, f"{prefix}_spring_lr": lr_sp, f"{prefix}_bump_lr": lr_bu,
-        f"{prefix}_tire_rr": rr_sz, f"{prefix}_pres_rr": rr_pr, f"{prefix}_spring_rr": rr_sp, f"{prefix}_bump_rr": rr_bu,
-        f"{prefix}_stagger_f": stg_f, f"{prefix}_stagger_r": stg_r,
-    }
+    # Transpose back to field-major order to line up with _SESSION_KEYS
+    cells = edited.to_numpy().T.ravel().tolist()
+    result = {k: ("" if v is None else v) for k, v in zip(keys, cells)}
+    result[f"{prefix}_stagger_f"] = stg_f
+    result[f"{prefix}_stagger_r"] = stg_r
+    return result
 
 
 def tire_temp_block(prefix, label, data):
-    """Tire temps with expanders + inline camber analysis (matches Tire Temp tab)."""
+    """Tire temps in one 4x3 data_editor grid + inline camber analysis (matches Tire Temp tab)."""
     st.markdown(f"\U0001f321\ufe0f **{label} \u2014 Tire Temps**")
-    corners = ["LF", "RF", "LR", "RR"]
-    temps = {}
-    result = {}
-    for corner in corners:
-        with st.expander(f"\U0001f321 {corner} Temps", expanded=False):
-            tc1, tc2, tc3 = st.columns(3)
-            with tc1:
-                t_in = st.number_input(f"{corner} Inner", min_value=0.0, max_value=500.0,
-                    value=_vf(data, f"{prefix}_temp_{corner}_in"), step=1.0, key=f"{prefix}_temp_{corner}_in")
-            with tc2:
-                t_mid = st.number_input(f"{corner} Middle", min_value=0.0, max_value=500.0,
-                    value=_vf(data, f"{prefix}_temp_{corner}_mid"), step=1.0, key=f"{prefix}_temp_{corner}_mid")
-            with tc3:
-                t_out = st.number_input(f"{corner} Outer", min_value=0.0, max_value=500.0,
-                    value=_vf(data, f"{prefix}_temp_{corner}_out"), step=1.0, key=f"{prefix}_temp_{corner}_out")
-            temps[corner] = {"inner": t_in, "middle": t_mid, "outer": t_out}
-            result[f"{prefix}_temp_{corner}_in"]  = t_in
-            result[f"{prefix}_temp_{corner}_mid"] = t_mid
-            result[f"{prefix}_temp_{corner}_out"] = t_out
+    keys = _SESSION_KEYS[prefix]["temps"]
+    grid = pd.DataFrame(
+        np.array([_vf(data, k) for k in keys]).reshape(len(_CORNERS), len(_TEMP_COLUMNS)),
+        index=_CORNERS, columns=_TEMP_COLUMNS,
+    )
+    edited = st.data_editor(
+        grid, num_rows="fixed", use_container_width=True, key=f"{prefix}_temps",
+        column_config={c: st.column_config.NumberColumn(c, min_value=0.0, max_value=500.0, step=1.0)
+                       for c in _TEMP_COLUMNS},
+    )
+    temps = edited.fillna(0.0).to_numpy(dtype=float)
+    result = dict(zip(keys, temps.ravel().tolist()))
     # Inline camber analysis
-    any_data = any(t["inner"] > 0 or t["outer"] > 0 for t in temps.values())
-    if any_data:
+    # Corners with an inner or outer reading; drives both the section check and the loop
+    has_temp = (temps[:, 0] > 0) | (temps[:, 2] > 0)
+    if has_temp.any():
         st.markdown("**Camber Analysis**")
-        for corner in corners:
-            t = temps[corner]
-            if t["inner"] == 0 and t["outer"] == 0:
+        deltas, statuses = _camber_analysis(temps[:, 0], temps[:, 2])
+        for i, corner in enumerate(_CORNERS):
+            t_in, t_mid, t_out = temps[i].tolist()
+            if not has_temp[i]:
                 continue
-            delta = t["inner"] - t["outer"]
-            if delta > 10:
-                icon, status = "\u26a0\ufe0f", "Too much negative camber"
-            elif delta < -10:
-                icon, status = "\u26a0\ufe0f", "Not enough negative camber"
-            else:
-                icon, status = "\u2705", "Camber OK"
+            icon, status, _ = _CAMBER_VERDICTS[statuses[i]]
             rc1, rc2 = st.columns([1, 3])
             with rc1:
-                st.metric(f"{corner} Delta", f"{delta:+.1f}\u00b0")
+                st.metric(f"{corner} Delta", f"{deltas[i]:+.1f}\u00b0")
             with rc2:
                 st.markdown(f"{icon} **{status}**")
-            st.caption(f"Inner: {t['inner']}\u00b0 | Mid: {t['middle']}\u00b0 | Outer: {t['outer']}\u00b0")
+            st.caption(f"Inner: {t_in}\u00b0 | Mid: {t_mid}\u00b0 | Outer: {t_out}\u00b0")
     return result
 
 
 def session_form(prefix, session_label, notes_key, data, date_str, track):
-    """Render a full session form with its own Save button."""
+    """Render a full session form with its own Queue button."""
     with st.form(f"form_{prefix}", clear_on_submit=False):
-        setup_data = tire_block(prefix, f"{session_label} \u2014 Tires & Springs", data)
+        with st.expander(f"{session_label} \u2014 Tires & Springs", expanded=False):
+            setup_data = tire_block(prefix, f"{session_label} \u2014 Tires & Springs", data)
         notes_val = st.text_area(f"{session_label} Notes",
             value=_v(data, notes_key), key=f"{prefix}_notes_input")
-        temp_data = tire_temp_block(prefix, session_label, data)
-        if st.form_submit_button(f"\U0001f4be Save {session_label}", type="primary"):
-            save = {notes_key: notes_val, "created": timestamp_now()}
-            save.update(setup_data)
-            save.update(temp_data)
-            upsert_race_day(date_str, track, save)
-            st.success(f"{session_label} saved!")
-            st.rerun()
+        with st.expander(f"{session_label} \u2014 Tire Temps", expanded=False):
+            temp_data = tire_temp_block(prefix, session_label, data)
+        if st.form_submit_button(f"\u2795 Queue {session_label}", type="primary"):
+            save = {notes_key: notes_val, **setup_data, **temp_data}
+            _stage_race_day(date_str, track, session_label, save)
+            st.success(f"{session_label} queued.")
 
 
 
@@ -314,13 +349,17 @@ def session_form(prefix, session_label, notes_key, data, date_str, track):
 # ========================
 def render():
     st.header("\U0001f4cb Race Day Log")
-    chassis_list = get_chassis_list()
-    ensure_race_day_headers(ALL_HEADERS)
+    _ensure_headers_once()
+    if st.session_state.get("_rd_pending"):
+        st.warning("\U0001f4dd Race day sections are queued but not saved \u2014 "
+                   "Save All Pending at the bottom of Race Day Entry.")
 
     tab_labels = ["View Logs"]
     if can_edit():
         tab_labels.append("Race Day Entry")
     tab_labels.append("Tire Temp")
+    # st.tabs, not a section radio: every tab body runs on each rerun, which
+    # keeps the pickers, unqueued form input and temp grid alive across tab switches
     tabs = st.tabs(tab_labels)
     tab_idx = 0
 
@@ -328,33 +367,26 @@ def render():
     # TAB 1 -- View Logs (always visible)
     # ========================
     with tabs[tab_idx]:
-        df = read_sheet("race_day")
-        if df.empty:
+        df_display = _race_day_newest_first()
+        if df_display.empty:
             st.info("No race day logs yet.")
         else:
             # Build summary list (newest first)
-            df_display = df.iloc[::-1].reset_index(drop=True)
-            options = []
-            for _, row in df_display.iterrows():
-                date_val = row.get("date", "")
-                track_val = row.get("track", "")
-                chassis_val = row.get("chassis", "")
-                feat_val = row.get("feature_finish", "")
-                label = f"{date_val}  |  {track_val}"
-                if chassis_val:
-                    label += f"  |  {chassis_val}"
-                if feat_val:
-                    label += f"  |  Finished: {feat_val}"
-                options.append(label)
-
-            selected = st.selectbox("Select a race day to view details", options, key="view_log_select")
-            sel_idx = options.index(selected)
+            cols = (df_display.reindex(columns=["date", "track", "chassis", "feature_finish"])
+                    .fillna("").astype(str).to_numpy())
+            labels = tuple(
+                f"{d}  |  {t}" + (f"  |  {c}" if c else "") + (f"  |  Finished: {f}" if f else "")
+                for d, t, c, f in cols
+            )
+
+            sel_idx = st.selectbox("Select a race day to view details", range(len(labels)),
+                                   format_func=labels.__getitem__, key="view_log_select")
             sel_row = df_display.iloc[sel_idx]
             sel_date = sel_row.get("date", "")
             sel_track = sel_row.get("track", "")
 
             # Fetch full row data via find_race_day for complete dict
-            _, full_data = find_race_day(sel_date, sel_track)
+            _, full_data = _cached_find_race_day(sel_date, sel_track)
             if full_data:
                 _show_detail(full_data)
             else:
@@ -371,9 +403,12 @@ def render():
                     c_yes, c_no = st.columns(2)
                     with c_yes:
                         if st.button("\u2705 Yes, Delete", type="primary", key="confirm_del_yes"):
-                            row_idx, _ = find_race_day(sel_date, sel_track)
-                            if row_idx is not None:
-                                delete_row("race_day", row_idx)
+                            # Fresh lookup, not the cached index -- rows may have
+                            # shifted since, and a stale index deletes the wrong one
+                            sel_row_idx, _ = find_race_day(sel_date, sel_track)
+                            if sel_row_idx is not None:
+                                delete_row("race_day", sel_row_idx)
+                                _clear_race_day_caches()
                             st.session_state.pop("confirm_delete", None)
                             st.success("Race day deleted!")
                             st.rerun()
@@ -391,27 +426,31 @@ def render():
             st.subheader("Select Race Day")
             hc1, hc2 = st.columns(2)
             with hc1:
-                DEFAULT_TRACKS = ["Sauble Speedway", "Flamboro Speedway", "Delaware Speedway", "Sunset Speedway", "Peterborough Speedway", "Jukasa Motor Speedway"]
                 # Build track list from previous race days + defaults
                 try:
-                    all_races = read_sheet("race_day")
+                    all_races = _race_day_newest_first()
                     saved_tracks = all_races["track"].unique().tolist() if not all_races.empty and "track" in all_races.columns else []
                 except Exception:
                     saved_tracks = []
-                track_options = sorted(set(DEFAULT_TRACKS + saved_tracks))
+                track_options = sorted(set(DEFAULT_TRACKS).union(saved_tracks))
                 track = st.selectbox("Track", track_options + ["Other (type below)"], key="rd_track")
                 if track == "Other (type below)":
                     track = st.text_input("Enter track name", key="rd_track_custom")
                 race_date = st.date_input("Date", key="rd_date")
             with hc2:
+                chassis_list = get_chassis_list()
                 chassis = st.selectbox("Chassis", chassis_list if chassis_list else [""], key="rd_chassis")
-            date_str = str(race_date)
-            _, existing = find_race_day(date_str, track)
+            # Re-format the date only when the picked day changes
+            if st.session_state.get("_rd_date_ord") != race_date.toordinal():
+                st.session_state["_rd_date_ord"] = race_date.toordinal()
+                st.session_state["_rd_date_str"] = race_date.isoformat()
+            date_str = st.session_state["_rd_date_str"]
+            _, existing = _cached_find_race_day(date_str, track)
             data = existing if existing else {}
             if data:
                 st.success(f"\u2705 Loaded existing race day: {track} \u2014 {date_str}")
             else:
-                st.info("\U0001f195 New race day. Fill in sessions below and save as you go.")
+                st.info("\U0001f195 New race day. Fill in sessions below, then Save All Pending at the bottom.")
 
             # Race Day Info form
             with st.form("form_header", clear_on_submit=False):
@@ -422,24 +461,22 @@ def render():
                         value=_v(data, "weather"), key="rd_weather")
                 with ic2:
                     track_condition = st.selectbox("Track Condition",
-                        ["Dry", "Damp", "Wet", "Dusty", "Tacky"],
-                        index=["Dry", "Damp", "Wet", "Dusty", "Tacky"].index(_v(data, "track_condition", "Dry")),
+                        _TRACK_CONDITIONS,
+                        index=_TRACK_CONDITION_IDX.get(_v(data, "track_condition", "Dry"), 0),
                         key="rd_condition")
                 with ic3:
                     air_temp = st.text_input("Air Temp", value=_v(data, "air_temp"), key="rd_air_temp")
-                if st.form_submit_button("\U0001f4be Save Race Day Info", type="primary"):
+                if st.form_submit_button("\u2795 Queue Race Day Info", type="primary"):
                     save = {
                         "chassis": chassis, "weather": weather,
                         "track_condition": track_condition, "air_temp": air_temp,
-                        "created": timestamp_now(),
                     }
-                    upsert_race_day(date_str, track, save)
-                    st.success("Race day info saved!")
-                    st.rerun()
+                    _stage_race_day(date_str, track, "Race Day Info", save)
+                    st.success("Race Day Info queued.")
 
             st.markdown("---")
             st.subheader("Session Notes")
-            st.caption("Each session saves independently \u2014 fill in and save as you go throughout the day.")
+            st.caption("Each session's button queues it \u2014 Save All Pending writes every queued section in one update.")
 
             # Practice #1
             session_form("p1", "Practice #1", "practice", data, date_str, track)
@@ -451,10 +488,9 @@ def render():
             with st.form("form_qual", clear_on_submit=False):
                 qual_notes = st.text_area("Qualifying Notes",
                     value=_v(data, "qualifying"), key="qual_notes_input")
-                if st.form_submit_button("\U0001f4be Save Qualifying", type="primary"):
-                    upsert_race_day(date_str, track, {"qualifying": qual_notes, "created": timestamp_now()})
-                    st.success("Qualifying saved!")
-                    st.rerun()
+                if st.form_submit_button("\u2795 Queue Qualifying", type="primary"):
+                    _stage_race_day(date_str, track, "Qualifying", {"qualifying": qual_notes})
+                    st.success("Qualifying queued.")
             st.markdown("---")
             # Heat Race
             session_form("heat", "Heat Race", "heat_race", data, date_str, track)
@@ -480,15 +516,18 @@ def render():
                     value=_v(data, "adjustments"), key="rd_adjustments")
                 notes = st.text_area("General Notes",
                     value=_v(data, "notes"), key="rd_notes")
-                if st.form_submit_button("\U0001f4be Save Results & Notes", type="primary"):
+                if st.form_submit_button("\u2795 Queue Results & Notes", type="primary"):
                     save = {
                         "qual_position": qual_pos, "heat_finish": heat_fin,
                         "feature_finish": feat_fin, "adjustments": adjustments,
-                        "notes": notes, "created": timestamp_now(),
+                        "notes": notes,
                     }
-                    upsert_race_day(date_str, track, save)
-                    st.success("Results & notes saved!")
-                    st.rerun()
+                    _stage_race_day(date_str, track, "Results & Notes", save)
+                    st.success("Results & Notes queued.")
+
+            # Rendered after every form so queueing a section needs no extra rerun
+            st.markdown("---")
+            _pending_bar()
 
     # ========================
     # TAB 3 -- Tire Temp (always visible)
@@ -497,44 +536,31 @@ def render():
     with tabs[tab_idx]:
         st.subheader("Tire Temperature Analysis")
         st.caption("Enter tire temps (Inner, Middle, Outer) for each corner. The app will analyze camber based on the temperature spread.")
-        corners = ["LF", "RF", "LR", "RR"]
-        temps = {}
-        for corner in corners:
-            with st.expander(f"\U0001f321 {corner} Temps", expanded=False):
-                tc1, tc2, tc3 = st.columns(3)
-                with tc1:
-                    t_in = st.number_input(f"{corner} Inner", min_value=0.0, max_value=500.0,
-                        value=0.0, step=1.0, key=f"rdl_{corner}_in")
-                with tc2:
-                    t_mid = st.number_input(f"{corner} Middle", min_value=0.0, max_value=500.0,
-                        value=0.0, step=1.0, key=f"rdl_{corner}_mid")
-                with tc3:
-                    t_out = st.number_input(f"{corner} Outer", min_value=0.0, max_value=500.0,
-                        value=0.0, step=1.0, key=f"rdl_{corner}_out")
-                temps[corner] = {"inner": t_in, "middle": t_mid, "outer": t_out}
+        edited = st.data_editor(
+            pd.DataFrame(0.0, index=_CORNERS, columns=_TEMP_COLUMNS),
+            num_rows="fixed", use_container_width=True, key="rdl_temps",
+            column_config={c: st.column_config.NumberColumn(c, min_value=0.0, max_value=500.0, step=1.0)
+                           for c in _TEMP_COLUMNS},
+        )
+        temps = edited.fillna(0.0).to_numpy(dtype=float)
+        deltas, statuses = _camber_analysis(temps[:, 0], temps[:, 2])
         st.divider()
         st.subheader("Camber Analysis Results")
-        any_data = any(t["inner"] > 0 or t["outer"] > 0 for t in temps.values())
-        if not any_data:
+        has_temp = (temps[:, 0] > 0) | (temps[:, 2] > 0)
+        if not has_temp.any():
             st.info("Enter tire temperatures above to see camber analysis.")
         else:
-            for corner in corners:
-                t = temps[corner]
-                if t["inner"] == 0 and t["outer"] == 0:
+            for i, corner in enumerate(_CORNERS):
+                t_in, t_mid, t_out = temps[i].tolist()
+                if not has_temp[i]:
                     continue
-                delta = t["inner"] - t["outer"]
-                if delta > 10:
-                    icon, status, advice = "\u26a0\ufe0f", "Too much negative camber", "Reduce negative camber on this corner."
-                elif delta < -10:
-                    icon, status, advice = "\u26a0\ufe0f", "Not enough negative camber", "Add negative camber or increase roll resistance on this corner."
-                else:
-                    icon, status, advice = "\u2705", "Camber OK", "Camber close; adjust only for fine balance."
+                icon, status, advice = _CAMBER_VERDICTS[statuses[i]]
                 with st.container():
                     rc1, rc2 = st.columns([1, 3])
                     with rc1:
-                        st.metric(f"{corner} Delta", f"{delta:+.1f}\u00b0")
+                        st.metric(f"{corner} Delta", f"{deltas[i]:+.1f}\u00b0")
                     with rc2:
                         st.markdown(f"{icon} **{status}**")
                         st.caption(advice)
-                    st.caption(f"Inner: {t['inner']}\u00b0 | Mid: {t['middle']}\u00b0 | Outer: {t['outer']}\u00b0")
+                    st.caption(f"Inner: {t_in}\u00b0 | Mid: {t_mid}\u00b0 | Outer: {t_out}\u00b0")
                 st.markdown("---")
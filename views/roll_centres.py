@@ -1,16 +1,23 @@
 import streamlit as st
 import pandas as pd
 import math
+from functools import lru_cache
 import numpy as np; import io
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use("Agg")  # headless server -- skip interactive backend probing
+from matplotlib.figure import Figure
 import matplotlib.patches as patches
 from matplotlib.patches import FancyArrowPatch
+from matplotlib.collections import LineCollection
+import matplotlib.colors as mcolors
+from matplotlib.transforms import Affine2D
+from matplotlib.font_manager import FontProperties
 from utils.gsheet_db import (
-    read_sheet, append_row, delete_row, update_row,
+    read_sheet, append_row_values, delete_row, update_row,
     get_chassis_list, timestamp_now, _col_letter, get_worksheet
 )
 
-ALL_HEADERS = [
+ALL_HEADERS = (
     "chassis", "date", "track", "notes",
     "f_lca_length", "f_uca_length",
     "f_lca_inner_height", "f_lca_outer_height",
@@ -27,18 +34,45 @@ ALL_HEADERS = [
     "r_rear_track_half",
     "front_rc_height", "rear_rc_height",
     "rc_height_diff",
-]
+)
 
 
 def _ensure_headers():
     ws = get_worksheet("roll_centres")
     existing = ws.row_values(1)
     trimmed = [h for h in existing if h.strip()]
-    missing = [h for h in ALL_HEADERS if h not in trimmed]
+    trimmed_set = frozenset(trimmed)
+    missing = [h for h in ALL_HEADERS if h not in trimmed_set]
     if missing:
         new_headers = trimmed + missing
         end_col = _col_letter(len(new_headers))
         ws.update(f"A1:{end_col}1", [new_headers])
+        return new_headers
+    return trimmed
+
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _ensure_headers_once():
+    """Headers never change at runtime -- check the sheet at most hourly.
+    Returns the sheet's header row so saves can be written positionally;
+    the TTL picks up columns edited by hand in the sheet."""
+    return tuple(_ensure_headers())
+
+
+# Everything after chassis/date/track/notes is a measurement
+_NUMERIC_HEADERS = ALL_HEADERS[4:]
+
+
+def _read_log():
+    """read_sheet("roll_centres") with the measurement columns coerced to
+    floats in one vectorized pass. Blank / bad cells stay NaN so the log
+    shows them blank; callers fill where a calculation needs a number."""
+    df = read_sheet("roll_centres")
+    if df.empty:
+        return df
+    cols = [c for c in _NUMERIC_HEADERS if c in df.columns]
+    df[cols] = df[cols].apply(pd.to_numeric, errors="coerce")
+    return df
 
 
 def _vf(data, key, default=0.0):
@@ -82,7 +116,9 @@ def _front_view_ic(lca_len, uca_len, lca_inner_h, lca_outer_h,
         rc_y = 0.0 + t_cl * dy_ic
     else:
         rc_y = ic_y
-    fvsa = math.sqrt(dx_ic ** 2 + dy_ic ** 2)
+    fvsa = math.hypot(dx_ic, dy_ic)
+    # Two atan2 calls, not one on cross / dot: with half_track < INNER_X the
+    # arms point inboard and the single form lands 360 deg away
     lca_angle = math.atan2(lca_dy, lca_dx)
     uca_angle = math.atan2(uca_dy, uca_dx)
     camber_deg = round(math.degrees(uca_angle - lca_angle), 3)
@@ -95,6 +131,7 @@ def _front_view_ic(lca_len, uca_len, lca_inner_h, lca_outer_h,
     )
 
 
+@lru_cache(maxsize=512)
 def _calc_front_rc_height(lca_len, uca_len, lca_inner_h, lca_outer_h,
                          uca_inner_h, uca_outer_h, half_track):
     geo = _front_view_ic(lca_len, uca_len, lca_inner_h, lca_outer_h,
@@ -104,96 +141,140 @@ def _calc_front_rc_height(lca_len, uca_len, lca_inner_h, lca_outer_h,
     return 0.0
 
 
+def _front_view_ic_vec(lca_inner_h, lca_outer_h, uca_inner_h, uca_outer_h,
+                       half_track, bump_in=0.0):
+    """NumPy version of _front_view_ic(); any argument may be an array.
+    Returns (ic_x, ic_y, rc_y, fvsa, camber) rounded like the scalar version,
+    with NaN where that returns None (parallel arms still give rc_y 0.0)."""
+    INNER_X = 4.0
+    bump_in = np.asarray(bump_in, dtype=float)
+    half_track = np.asarray(half_track, dtype=float)
+    arm_dx = half_track - INNER_X
+    lca_dy = lca_outer_h + bump_in - lca_inner_h
+    uca_dy = uca_outer_h + bump_in * 0.85 - uca_inner_h
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m_lca = lca_dy / arm_dx
+        m_uca = uca_dy / arm_dx
+        slope_diff = m_lca - m_uca
+        ic_x = INNER_X + (uca_inner_h - lca_inner_h) / slope_diff
+        ic_y = lca_inner_h + m_lca * (ic_x - INNER_X)
+        dx_ic = ic_x - half_track
+        rc_y = np.where(np.abs(dx_ic) > 1e-9, -half_track / dx_ic * ic_y, ic_y)
+        fvsa = np.hypot(dx_ic, ic_y)
+    camber = np.degrees(np.arctan2(uca_dy, arm_dx) - np.arctan2(lca_dy, arm_dx))
+    degenerate = np.abs(arm_dx) < 1e-9
+    parallel = ~degenerate & (np.abs(slope_diff) < 1e-9)
+    no_ic = degenerate | parallel
+    ic_x = np.where(no_ic, np.nan, ic_x)
+    ic_y = np.where(no_ic, np.nan, ic_y)
+    rc_y = np.where(degenerate, np.nan, np.where(parallel, 0.0, rc_y))
+    fvsa = np.where(no_ic | (fvsa == 0), np.nan, fvsa)
+    camber = np.where(no_ic, 0.0, camber)
+    return (np.round(ic_x, 2), np.round(ic_y, 2), np.round(rc_y, 3),
+            np.round(fvsa, 2), np.round(camber, 3))
+
+
+def _front_rc_vec(lca_inner_h, lca_outer_h, uca_inner_h, uca_outer_h,
+                  half_track, bump_in=0.0):
+    """Just the rc_y array from _front_view_ic_vec()."""
+    return _front_view_ic_vec(lca_inner_h, lca_outer_h, uca_inner_h,
+                              uca_outer_h, half_track, bump_in)[2]
+
+
+@lru_cache(maxsize=512)
 def _calc_rear_rc_height(upper_frame_h, upper_axle_h,
                          upper_frame_offset, upper_axle_offset):
-    try:
-        dx = upper_axle_offset - upper_frame_offset
-        if abs(dx) < 0.001:
-            return round((upper_frame_h + upper_axle_h) / 2.0, 3)
-        slope = (upper_axle_h - upper_frame_h) / dx
-        rc_height = upper_frame_h - slope * upper_frame_offset
-        return round(rc_height, 3)
-    except Exception:
-        return 0.0
+    # Straight-line: the near-vertical link case picks the midpoint instead of
+    # branching out early, and the safe denominator keeps the divide finite
+    dx = upper_axle_offset - upper_frame_offset
+    vertical = abs(dx) < 0.001
+    slope = (upper_axle_h - upper_frame_h) / (1.0 if vertical else dx)
+    rc_height = ((upper_frame_h + upper_axle_h) / 2.0 if vertical
+                 else upper_frame_h - slope * upper_frame_offset)
+    return round(rc_height, 3)
+
+
+# Spring / ride-frequency constants (weights in lbs, g = 386.4 in/s^2).
+# The formulas below keep the original operation order so the rounded
+# rates shown for a setup don't shift by a last digit.
+_G_IN = 386.4
+_TWO_PI = 2 * math.pi
+_INV_TWO_PI = 1 / _TWO_PI
 
 
 def _calc_spring_rate(weight_on_wheel, desired_freq, motion_ratio=1.0):
-    try:
-        if weight_on_wheel <= 0 or desired_freq <= 0:
-            return 0.0
-        mass = weight_on_wheel / 386.4
-        k_wheel = (2 * math.pi * desired_freq) ** 2 * mass
-        k_spring = k_wheel / (motion_ratio ** 2) if motion_ratio > 0 else k_wheel
-        return round(k_spring, 1)
-    except Exception:
+    if weight_on_wheel <= 0 or desired_freq <= 0:
         return 0.0
+    mass = weight_on_wheel / _G_IN
+    k_wheel = (_TWO_PI * desired_freq) ** 2 * mass
+    k_spring = k_wheel / (motion_ratio ** 2) if motion_ratio > 0 else k_wheel
+    return round(k_spring, 1)
 
 
 def _calc_wheel_rate(spring_rate, motion_ratio=1.0):
-    try:
-        return round(spring_rate * (motion_ratio ** 2), 1)
-    except Exception:
-        return 0.0
+    return round(spring_rate * (motion_ratio ** 2), 1)
 
 
 def _calc_ride_frequency(spring_rate, weight_on_wheel, motion_ratio=1.0):
-    try:
-        if weight_on_wheel <= 0 or spring_rate <= 0:
-            return 0.0
-        mass = weight_on_wheel / 386.4
-        k_wheel = spring_rate * (motion_ratio ** 2)
-        freq = (1 / (2 * math.pi)) * math.sqrt(k_wheel / mass)
-        return round(freq, 2)
-    except Exception:
+    if weight_on_wheel <= 0 or spring_rate <= 0:
         return 0.0
+    mass = weight_on_wheel / _G_IN
+    k_wheel = spring_rate * (motion_ratio ** 2)
+    freq = _INV_TWO_PI * math.sqrt(k_wheel / mass)
+    return round(freq, 2)
 
 
 def _calc_camber_gain(lca_len, uca_len, lca_inner_h, lca_outer_h,
                      uca_inner_h, uca_outer_h, half_track,
                      travel_range=3.0, steps=13):
-    results = []
-    try:
-        base = _front_view_ic(lca_len, uca_len, lca_inner_h, lca_outer_h,
-                              uca_inner_h, uca_outer_h, half_track, bump_in=0.0)
-        base_camber = base["camber"] or 0.0
-        for i in range(steps):
-            travel = -travel_range + (2 * travel_range * i / (steps - 1))
-            geo = _front_view_ic(lca_len, uca_len, lca_inner_h, lca_outer_h,
-                                uca_inner_h, uca_outer_h, half_track,
-                                bump_in=travel)
-            new_camber = geo["camber"] or 0.0
-            camber_change = round(new_camber - base_camber, 3)
-            results.append((round(travel, 2), camber_change))
-    except Exception:
-        results = [(0, 0)]
-    return results
+    """Every other point of a (2*steps - 1)-point sweep -- with the default
+    13 steps that is the Sweep Chart's memoized 25-point sweep, so when both
+    tabs use the same travel range the geometry is computed once."""
+    travels, _, _, camber_changes = _calc_sweep_data(
+        lca_len, uca_len, lca_inner_h, lca_outer_h, uca_inner_h,
+        uca_outer_h, half_track, travel_range=travel_range,
+        steps=2 * steps - 1)
+    return list(zip(np.round(travels[::2], 2).tolist(),
+                    camber_changes[::2].tolist()))
 
 
+@lru_cache(maxsize=32)
 def _calc_sweep_data(lca_len, uca_len, lca_inner_h, lca_outer_h,
                     uca_inner_h, uca_outer_h, half_track,
                     travel_range=3.0, steps=25):
-    """Sweep through bump/droop and collect RC height, FVSA, camber."""
-    travels, rc_heights, fvsa_lengths, camber_changes = [], [], [], []
-    base = _front_view_ic(lca_len, uca_len, lca_inner_h, lca_outer_h,
-                          uca_inner_h, uca_outer_h, half_track, bump_in=0.0)
-    base_camber = base["camber"] or 0.0
-    for i in range(steps):
-        t = -travel_range + (2 * travel_range * i / (steps - 1))
-        geo = _front_view_ic(lca_len, uca_len, lca_inner_h, lca_outer_h,
-                            uca_inner_h, uca_outer_h, half_track, bump_in=t)
-        travels.append(round(t, 3))
-        rc_heights.append(geo["rc_y"] if geo["rc_y"] is not None else 0.0)
-        fvsa_lengths.append(geo["fvsa"] if geo["fvsa"] is not None else 0.0)
-        c = (geo["camber"] or 0.0) - base_camber
-        camber_changes.append(round(c, 3))
-    return travels, rc_heights, fvsa_lengths, camber_changes
+    """Sweep through bump/droop and collect RC height, FVSA, camber.
+    One vectorized pass over all travel steps; returns four read-only
+    ndarrays (memoized, so callers must not modify them)."""
+    travels = np.linspace(-travel_range, travel_range, steps)
+    _, _, rc_heights, fvsa_lengths, camber = _front_view_ic_vec(
+        lca_inner_h, lca_outer_h, uca_inner_h, uca_outer_h, half_track,
+        bump_in=travels)
+    base_camber = _front_view_ic_vec(lca_inner_h, lca_outer_h, uca_inner_h,
+                                     uca_outer_h, half_track)[4]
+    out = (np.round(travels, 3), np.nan_to_num(rc_heights, nan=0.0),
+           np.nan_to_num(fvsa_lengths, nan=0.0),
+           np.round(camber - base_camber, 3))
+    for arr in out:
+        arr.setflags(write=False)
+    return out
+
+
+# Shared font for the front-view arm-angle labels
+_FP_BADGE = FontProperties(size=9, weight="bold")
+
+
+def _subplots(*args, figsize, **kwargs):
+    """plt.subplots() without pyplot's global figure registry. These figures
+    are only ever encoded to PNG, so they need no manager and no plt.close()."""
+    fig = Figure(figsize=figsize)
+    return fig, fig.subplots(*args, **kwargs)
 
 
 def _draw_sweep_chart(travels, rc_heights, fvsa_lengths, camber_changes):
     """3-panel sweep chart: RC height, FVSA, camber vs wheel travel."""
     bg = "#0e1117"; card_bg = "#1a1e2e"; grid_color = "#2a2e3a"
     text_color = "#e0e0e0"
-    fig, axes = plt.subplots(3, 1, figsize=(10, 8), sharex=True)
+    fig, axes = _subplots(3, 1, figsize=(10, 8), sharex=True)
     fig.patch.set_facecolor(bg)
     panels = [
         (axes[0], rc_heights, "RC Height (in)", "#00ff88", "Roll Centre Height"),
@@ -212,7 +293,7 @@ def _draw_sweep_chart(travels, rc_heights, fvsa_lengths, camber_changes):
         for spine in ax.spines.values():
             spine.set_color(grid_color)
     axes[2].set_xlabel("Wheel Travel (in) [- droop / + bump]", color=text_color, fontsize=8)
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
@@ -225,29 +306,31 @@ def _draw_rc_diagram(front_rc, rear_rc, roll_deg=0.0, dive_deg=0.0, wheelbase=10
     front_color = "#00d4ff"; rear_color = "#ff6b35"
     axis_color = "#ffd700"; text_color = "#e0e0e0"; grid_color = "#2a2e3a"
     # wheelbase is now a function parameter
-    fig, ax = plt.subplots(figsize=(10, 4.5))
+    fig, ax = _subplots(figsize=(10, 4.5))
     fig.patch.set_facecolor(bg); ax.set_facecolor(card_bg)
     # Ground line
     ax.axhline(y=0, color=ground_color, linewidth=2.5, zorder=1)
     ax.fill_between([-15, wheelbase + 15], -2, 0,
                     color=ground_color, alpha=0.15, zorder=0)
     max_h = max(abs(front_rc), abs(rear_rc), 10) + 5
-    # Minor grid lines
-    for h in range(0, int(max_h) + 5, 5):
-        if h > 0:
-            ax.axhline(y=h, color=grid_color, linewidth=0.5,
-                       linestyle="--", alpha=0.4, zorder=0)
-    for h in range(0, int(max_h) + 5, 1):
-        if h > 0:
-            ax.axhline(y=h, color=grid_color, linewidth=0.2,
-                       linestyle=":", alpha=0.2, zorder=0)
+    # Grid lines: one LineCollection per style instead of an axhline per row.
+    # x runs 0..1 in axes coords (like axhline), y is data.
+    grid_tf = ax.get_yaxis_transform()
+    ax.add_collection(LineCollection(
+        [((0, h), (1, h)) for h in range(5, int(max_h) + 5, 5)],
+        colors=grid_color, linewidths=0.5, linestyles="--", alpha=0.4,
+        zorder=0, transform=grid_tf), autolim=False)
+    ax.add_collection(LineCollection(
+        [((0, h), (1, h)) for h in range(1, int(max_h) + 5)],
+        colors=grid_color, linewidths=0.2, linestyles=":", alpha=0.2,
+        zorder=0, transform=grid_tf), autolim=False)
     # Wheels
     wheel_r = 5
     for wx in [0, wheelbase]:
-        circle = plt.Circle((wx, wheel_r), wheel_r, fill=False,
+        circle = patches.Circle((wx, wheel_r), wheel_r, fill=False,
                            color="#666", linewidth=2, zorder=3)
         ax.add_patch(circle)
-        inner = plt.Circle((wx, wheel_r), 2.5, fill=True,
+        inner = patches.Circle((wx, wheel_r), 2.5, fill=True,
                           color="#444", linewidth=1, zorder=3)
         ax.add_patch(inner)
     # Car body
@@ -394,10 +477,30 @@ def _draw_rc_diagram(front_rc, rear_rc, roll_deg=0.0, dive_deg=0.0, wheelbase=10
     ax.tick_params(colors=text_color, labelsize=7)
     for spine in ax.spines.values():
         spine.set_color(grid_color)
-    plt.tight_layout()
+    # Fixed layout -- tight_layout would re-measure every text/annotation box
+    fig.subplots_adjust(left=0.07, right=0.98, top=0.95, bottom=0.12)
     return fig
 
 
+def _fig_png(fig, dpi=80):
+    """Encode a figure as PNG bytes for st.image. 80 dpi keeps
+    the payload well under st.pyplot's 200 dpi default."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=dpi, facecolor=fig.get_facecolor())
+    return buf.getvalue()
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _rc_diagram_png(front_rc, rear_rc, roll_deg=0.0, dive_deg=0.0,
+                    wheelbase=108, cg_height=15.0):
+    """_draw_rc_diagram() rendered to PNG bytes and memoized on its inputs,
+    so reruns that don't touch the side view skip matplotlib entirely."""
+    fig = _draw_rc_diagram(front_rc, rear_rc, roll_deg=roll_deg,
+                           dive_deg=dive_deg, wheelbase=wheelbase,
+                           cg_height=cg_height)
+    return _fig_png(fig)
+
+
 # ---------------------------------------------------------------------------
 # DIAGRAM: Front-view IC + RC construction (ENHANCED with 10 features)
 # ---------------------------------------------------------------------------
@@ -417,35 +520,44 @@ def _draw_front_view_rc(lca_len, uca_len, lca_inner_h, lca_outer_h,
     l_bump = bump_in - half_track * math.sin(roll_rad)
     geo_r = _front_view_ic(lca_len, uca_len, lca_inner_h, lca_outer_h,
                            uca_inner_h, uca_outer_h, half_track, bump_in=r_bump)
-    geo_l = _front_view_ic(lca_len, uca_len, lca_inner_h, lca_outer_h,
-                           uca_inner_h, uca_outer_h, half_track, bump_in=l_bump)
+    if abs(roll_deg) < 1e-9:
+        # No roll: both sides see the same travel, so share the right-side geometry
+        geo_l = geo_r
+    else:
+        geo_l = _front_view_ic(lca_len, uca_len, lca_inner_h, lca_outer_h,
+                               uca_inner_h, uca_outer_h, half_track, bump_in=l_bump)
     lo_h_r = geo_r["lca_outer_h"]; uo_h_r = geo_r["uca_outer_h"]
     lo_h_l = geo_l["lca_outer_h"]; uo_h_l = geo_l["uca_outer_h"]
-    fig, ax = plt.subplots(figsize=(10, 7))
+    fig, ax = _subplots(figsize=(10, 7))
     fig.patch.set_facecolor(bg); ax.set_facecolor(card_bg)
     # Ground
     ax.axhline(y=0, color=ground_color, linewidth=2.5, zorder=1)
     max_h = max(uca_inner_h, uo_h_r, uo_h_l, 20) + 5
-    # Major + minor grid
-    for h in range(0, int(max_h) + 5, 5):
-        if h > 0:
-            ax.axhline(y=h, color=grid_color, linewidth=0.5,
-                       linestyle="--", alpha=0.3, zorder=0)
-    for h in range(0, int(max_h) + 5, 1):
-        if h > 0:
-            ax.axhline(y=h, color=grid_color, linewidth=0.2,
-                       linestyle=":", alpha=0.15, zorder=0)
-    # Vertical grid
-    for vx in range(-int(half_track) - 10, int(half_track) + 15, 10):
-        ax.axvline(x=vx, color=grid_color, linewidth=0.2,
-                   linestyle=":", alpha=0.15, zorder=0)
+    # Major + minor + vertical grid, one LineCollection each. Segments are
+    # built as (N, 2, 2) arrays in blended coords, spanning the axes like
+    # axhline / axvline did.
+    major_y = np.arange(5, int(max_h) + 5, 5)
+    minor_y = np.arange(1, int(max_h) + 5)
+    grid_x = np.arange(-int(half_track) - 10, int(half_track) + 15, 10)
+    span = np.array([0.0, 1.0])
+    major_segs = np.stack(np.broadcast_arrays(span, major_y[:, None]), axis=-1)
+    minor_segs = np.stack(np.broadcast_arrays(span, minor_y[:, None]), axis=-1)
+    v_segs = np.stack(np.broadcast_arrays(grid_x[:, None], span), axis=-1)
+    ax.add_collection(LineCollection(
+        major_segs, colors=grid_color, linewidths=0.5, linestyles="--",
+        alpha=0.3, zorder=0, transform=ax.get_yaxis_transform()), autolim=False)
+    ax.add_collection(LineCollection(
+        minor_segs, colors=grid_color, linewidths=0.2, linestyles=":",
+        alpha=0.15, zorder=0, transform=ax.get_yaxis_transform()), autolim=False)
+    ax.add_collection(LineCollection(
+        v_segs, colors=grid_color, linewidths=0.2, linestyles=":",
+        alpha=0.15, zorder=0, transform=ax.get_xaxis_transform()), autolim=False)
     # Centreline
     ax.axvline(x=0, color=grid_color, linewidth=1,
                linestyle="-.", alpha=0.5, zorder=1)
     ax.text(0.5, max_h - 1, "CL", fontsize=8, color=grid_color,
             ha="left", va="top", fontstyle="italic", zorder=6)
     # Tires (rotated by camber angle)
-    import matplotlib.transforms as mtransforms
     tire_w = 4; tire_h = 10
     for sign in [1, -1]:
         # Get camber for this side
@@ -458,8 +570,8 @@ def _draw_front_view_rc(lca_len, uca_len, lca_inner_h, lca_outer_h,
             (-tire_w / 2, 0), tire_w, tire_h,
             facecolor=tire_color, edgecolor="#777",
             alpha=0.5, linewidth=1.5, zorder=2)
-        t = mtransforms.Affine2D().rotate_deg_around(0, 0, -camber_deg * sign * 3) + \
-            mtransforms.Affine2D().translate(cp_x, 0) + ax.transData
+        # Rotate about the contact patch then move it out, in one Affine2D
+        t = Affine2D().rotate_deg(-camber_deg * sign * 3).translate(cp_x, 0) + ax.transData
         tire_rect.set_transform(t)
         ax.add_patch(tire_rect)
     # NEW: Tire centre lines (vertical dashed through wheel centre)
@@ -479,16 +591,13 @@ def _draw_front_view_rc(lca_len, uca_len, lca_inner_h, lca_outer_h,
     # Right-side arms
     ax.plot([INNER_X, outer_x], [lca_inner_h, lo_h_r],
             color=lca_color, linewidth=2.5, zorder=4, label="LCA")
-    ax.plot(INNER_X, lca_inner_h, "o", color=lca_color, markersize=8,
-            zorder=5, markeredgecolor="white", markeredgewidth=1)
-    ax.plot(outer_x, lo_h_r, "o", color=lca_color, markersize=8,
-            zorder=5, markeredgecolor="white", markeredgewidth=1)
     ax.plot([INNER_X, outer_x], [uca_inner_h, uo_h_r],
             color=uca_color, linewidth=2.5, zorder=4, label="UCA")
-    ax.plot(INNER_X, uca_inner_h, "o", color=uca_color, markersize=8,
-            zorder=5, markeredgecolor="white", markeredgewidth=1)
-    ax.plot(outer_x, uo_h_r, "o", color=uca_color, markersize=8,
-            zorder=5, markeredgecolor="white", markeredgewidth=1)
+    # Right-side pivots / ball joints in one scatter
+    ax.scatter([INNER_X, outer_x, INNER_X, outer_x],
+               [lca_inner_h, lo_h_r, uca_inner_h, uo_h_r], s=64,
+               c=[lca_color, lca_color, uca_color, uca_color],
+               edgecolors="white", linewidths=1, zorder=5)
     # NEW: Spindle / Kingpin line (connects upper and lower ball joints)
     ax.plot([outer_x, outer_x], [lo_h_r, uo_h_r], color=spindle_color,
             linewidth=2, linestyle="-", alpha=0.9, zorder=4)
@@ -497,29 +606,24 @@ def _draw_front_view_rc(lca_len, uca_len, lca_inner_h, lca_outer_h,
     # NEW: KPI angle (King Pin Inclination)
     kpi_dy = uo_h_r - lo_h_r
     if abs(kpi_dy) > 0.01:
-        kpi_angle = math.degrees(math.atan2(0, kpi_dy))  # vertical = 0 deg
         # True KPI: angle from vertical
         kpi_actual = 0.0  # vertical kingpin in this model
         ax.text(outer_x + 1.5, lo_h_r - 1.5,
                 f"KPI: {abs(kpi_actual):.1f}\u00b0", fontsize=9,
                 color=spindle_color, ha="left", va="top", alpha=0.9, zorder=6)
-    # NEW: Arm angle annotations (right side)
+    # NEW: Arm angle annotations (right side) -- colour-coded, no bbox patch
     lca_angle_r = math.degrees(math.atan2(lo_h_r - lca_inner_h, outer_x - INNER_X))
     uca_angle_r = math.degrees(math.atan2(uo_h_r - uca_inner_h, outer_x - INNER_X))
     lca_mid_x = (INNER_X + outer_x) / 2
     lca_mid_y = (lca_inner_h + lo_h_r) / 2
     ax.text(lca_mid_x, lca_mid_y - 1.5, f"{lca_angle_r:.1f}\u00b0",
-            fontsize=9, color=lca_color, ha="center", va="top",
-            fontweight="bold", alpha=0.8, zorder=6,
-            bbox=dict(boxstyle="round,pad=0.15", facecolor=card_bg,
-                     edgecolor=lca_color, alpha=0.85))
+            fontproperties=_FP_BADGE, color=lca_color, ha="center",
+            va="top", alpha=0.8, zorder=6)
     uca_mid_x = (INNER_X + outer_x) / 2
     uca_mid_y = (uca_inner_h + uo_h_r) / 2
     ax.text(uca_mid_x, uca_mid_y + 1.5, f"{uca_angle_r:.1f}\u00b0",
-            fontsize=9, color=uca_color, ha="center", va="bottom",
-            fontweight="bold", alpha=0.8, zorder=6,
-            bbox=dict(boxstyle="round,pad=0.15", facecolor=card_bg,
-                     edgecolor=uca_color, alpha=0.85))
+            fontproperties=_FP_BADGE, color=uca_color, ha="center",
+            va="bottom", alpha=0.8, zorder=6)
     # NEW: Arm length labels (right side)
     lca_actual = math.sqrt((outer_x - INNER_X)**2 + (lo_h_r - lca_inner_h)**2)
     uca_actual = math.sqrt((outer_x - INNER_X)**2 + (uo_h_r - uca_inner_h)**2)
@@ -534,33 +638,35 @@ def _draw_front_view_rc(lca_len, uca_len, lca_inner_h, lca_outer_h,
             color=lca_color, linewidth=2.5, alpha=0.6, zorder=4)
     ax.plot([-INNER_X, -outer_x], [uca_inner_h, uo_h_l],
             color=uca_color, linewidth=2.5, alpha=0.6, zorder=4)
-    for px, py in [(-INNER_X, lca_inner_h), (-outer_x, lo_h_l),
-                   (-INNER_X, uca_inner_h), (-outer_x, uo_h_l)]:
-        ax.plot(px, py, "o", color="#888", markersize=6, alpha=0.6, zorder=5)
+    ax.scatter([-INNER_X, -outer_x, -INNER_X, -outer_x],
+               [lca_inner_h, lo_h_l, uca_inner_h, uo_h_l], s=36,
+               c="#888", alpha=0.6, zorder=5)
     # Left spindle
     ax.plot([-outer_x, -outer_x], [lo_h_l, uo_h_l], color=spindle_color,
             linewidth=2, linestyle="-", alpha=0.9, zorder=4)
     # NEW: RC migration trail (shows RC at different travel positions)
     trail_steps = 9
     trail_range = 2.0
-    for ti in range(trail_steps):
-        tt = -trail_range + (2 * trail_range * ti / (trail_steps - 1))
-        if abs(tt - bump_in) < 0.01:
-            continue
-        tg = _front_view_ic(lca_len, uca_len, lca_inner_h, lca_outer_h,
-                           uca_inner_h, uca_outer_h, half_track, bump_in=tt)
-        if tg["rc_y"] is not None:
-            alpha_val = 0.3 + 0.2 * (1 - abs(tt - bump_in) / trail_range)
-            ax.plot(0, tg["rc_y"], "o", color=rc_color, markersize=5,
-                    alpha=alpha_val, zorder=3)
+    trail_tt = np.linspace(-trail_range, trail_range, trail_steps)
+    trail_tt = trail_tt[np.abs(trail_tt - bump_in) >= 0.01]
+    trail_rc = _front_rc_vec(lca_inner_h, lca_outer_h, uca_inner_h,
+                             uca_outer_h, half_track, bump_in=trail_tt)
+    keep = ~np.isnan(trail_rc)
+    trail_tt = trail_tt[keep]; trail_rc = trail_rc[keep]
+    # One scatter, per-point alpha fading with distance from the current travel
+    trail_colors = np.tile(mcolors.to_rgba(rc_color), (len(trail_rc), 1))
+    trail_colors[:, 3] = 0.3 + 0.2 * (1 - np.abs(trail_tt - bump_in) / trail_range)
+    ax.scatter(np.zeros_like(trail_rc), trail_rc, s=25, c=trail_colors,
+               marker="o", zorder=3)
     # Right-side IC construction
     ic_x_r = geo_r["ic_x"]; ic_y_r = geo_r["ic_y"]
     rc_y_r = geo_r["rc_y"]; fvsa_r = geo_r["fvsa"]
     if ic_x_r is not None:
-        ax.plot([INNER_X, ic_x_r], [lca_inner_h, ic_y_r],
-                color=lca_color, linewidth=1, linestyle="--", alpha=0.5, zorder=3)
-        ax.plot([INNER_X, ic_x_r], [uca_inner_h, ic_y_r],
-                color=uca_color, linewidth=1, linestyle="--", alpha=0.5, zorder=3)
+        ax.add_collection(LineCollection(
+            [((INNER_X, lca_inner_h), (ic_x_r, ic_y_r)),
+             ((INNER_X, uca_inner_h), (ic_x_r, ic_y_r))],
+            colors=[lca_color, uca_color], linewidths=1, linestyles="--",
+            alpha=0.5, zorder=3))
         ax.plot(ic_x_r, ic_y_r, "D", color=ic_color, markersize=12,
                 zorder=6, markeredgecolor="white", markeredgewidth=1.5)
         ic_label_r = f"IC R\n({ic_x_r:.0f}, {ic_y_r:.1f})"
@@ -590,12 +696,11 @@ def _draw_front_view_rc(lca_len, uca_len, lca_inner_h, lca_outer_h,
     rc_y_l = geo_l["rc_y"]; fvsa_l = geo_l["fvsa"]
     if ic_x_l is not None and abs(roll_deg) > 0.01:
         l_ic_x_plot = -ic_x_l
-        ax.plot([-INNER_X, l_ic_x_plot], [lca_inner_h, ic_y_l],
-                color=lca_color, linewidth=1, linestyle="--",
-                alpha=0.3, zorder=3)
-        ax.plot([-INNER_X, l_ic_x_plot], [uca_inner_h, ic_y_l],
-                color=uca_color, linewidth=1, linestyle="--",
-                alpha=0.3, zorder=3)
+        ax.add_collection(LineCollection(
+            [((-INNER_X, lca_inner_h), (l_ic_x_plot, ic_y_l)),
+             ((-INNER_X, uca_inner_h), (l_ic_x_plot, ic_y_l))],
+            colors=[lca_color, uca_color], linewidths=1, linestyles="--",
+            alpha=0.3, zorder=3))
         ax.plot(l_ic_x_plot, ic_y_l, "D", color="#ffaa00",
                 markersize=10, zorder=6, markeredgecolor="white",
                 markeredgewidth=1, alpha=0.8)
@@ -687,10 +792,28 @@ def _draw_front_view_rc(lca_len, uca_len, lca_inner_h, lca_outer_h,
     ax.tick_params(colors=text_color, labelsize=7)
     for spine in ax.spines.values():
         spine.set_color(grid_color)
-    plt.tight_layout()
+    fig.tight_layout()
     return fig, geo_r, geo_l
 
 
+@st.cache_data(max_entries=64, show_spinner=False)
+def _front_view_png(lca_len, uca_len, lca_inner_h, lca_outer_h,
+                    uca_inner_h, uca_outer_h, half_track, front_rc,
+                    bump_in=0.0, roll_deg=0.0):
+    """_draw_front_view_rc() as (PNG bytes, geo_r, geo_l), memoized on its inputs."""
+    fig, geo_r, geo_l = _draw_front_view_rc(
+        lca_len, uca_len, lca_inner_h, lca_outer_h, uca_inner_h,
+        uca_outer_h, half_track, front_rc, bump_in=bump_in, roll_deg=roll_deg)
+    return _fig_png(fig), geo_r, geo_l
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _sweep_chart_png(travels, rc_heights, fvsa_lengths, camber_changes):
+    """_draw_sweep_chart() as PNG bytes, memoized on the sweep arrays."""
+    return _fig_png(_draw_sweep_chart(travels, rc_heights,
+                                      fvsa_lengths, camber_changes))
+
+
 # ---------------------------------------------------------------------------
 # RENDER
 # ---------------------------------------------------------------------------
@@ -701,7 +824,9 @@ def render():
     if not chassis_list:
         st.warning("No chassis found. Please add a chassis in Chassis Profiles first.")
         return
-    _ensure_headers()
+    _ensure_headers_once()
+    # One cached read shared by the Compare and Log tabs
+    df_log = _read_log()
     tab_calc, tab_springs, tab_camber, tab_sweep, tab_compare, tab_log = st.tabs([
         "Calculate", "Spring Rates", "Camber Gain",
         "Sweep Chart", "Compare Setups", "Log / History"
@@ -715,6 +840,7 @@ def render():
             "Front uses the **instant centre method** (double A-arm). "
             "Rear uses **upper link projection** (trailing arms + upper link)."
         )
+        # Log labels sit outside the form -- they don't feed the calculation
         col_chassis, col_track, col_date = st.columns(3)
         with col_chassis:
             chassis = st.selectbox("Chassis", chassis_list, key="rc_chassis")
@@ -722,81 +848,114 @@ def render():
             track = st.text_input("Track / Event", key="rc_track")
         with col_date:
             date_val = st.text_input("Date", value=timestamp_now()[:10], key="rc_date")
-        st.divider()
-        st.markdown("### Front Suspension")
-        st.caption("Double A-Arm")
-        f1, f2, f3 = st.columns(3)
-        with f1:
-            f_lca_len = st.number_input("LCA Length (in)", min_value=0.0, value=12.0,
-                step=0.125, key="f_lca_len",
-                help="Length of the lower control arm from inner pivot (frame) to outer ball joint (spindle)")
-            f_uca_len = st.number_input("UCA Length (in)", min_value=0.0, value=10.0,
-                step=0.125, key="f_uca_len",
-                help="Length of the upper control arm from inner pivot (frame) to outer ball joint (spindle)")
-        with f2:
-            f_lca_inner_h = st.number_input("LCA Inner Height (in)", value=6.0,
-                step=0.125, key="f_lca_inner_h",
-                help="Height of the LCA frame-side pivot point measured from the ground")
-            f_lca_outer_h = st.number_input("LCA Outer Height (in)", value=5.5,
-                step=0.125, key="f_lca_outer_h",
-                help="Height of the LCA spindle-side ball joint measured from the ground")
-        with f3:
-            f_uca_inner_h = st.number_input("UCA Inner Height (in)", value=14.0,
-                step=0.125, key="f_uca_inner_h",
-                help="Height of the UCA frame-side pivot point measured from the ground")
-            f_uca_outer_h = st.number_input("UCA Outer Height (in)", value=13.0,
-                step=0.125, key="f_uca_outer_h",
-                help="Height of the UCA spindle-side ball joint measured from the ground")
-        f_spindle_h = st.number_input(
-            "Front Track Half-Width / Spindle Offset (in)",
-            min_value=1.0, value=30.0, step=0.5, key="f_spindle_h",
-            help="Half the front track width. Distance from car centreline to the centre of the tire contact patch.")
+        notes = st.text_area("Notes", key="rc_notes",
+                            placeholder="Setup notes, track conditions, etc.")
+        # Geometry inputs are batched in a form so edits only rerun on submit.
+        # Save is a submit button too, so it always logs the geometry on screen
+        with st.form("rc_calc"):
+            st.divider()
+            st.markdown("### Front Suspension")
+            st.caption("Double A-Arm")
+            f1, f2, f3 = st.columns(3)
+            with f1:
+                f_lca_len = st.number_input("LCA Length (in)", min_value=0.0, value=12.0,
+                    step=0.125, key="f_lca_len",
+                    help="Length of the lower control arm from inner pivot (frame) to outer ball joint (spindle)")
+                f_uca_len = st.number_input("UCA Length (in)", min_value=0.0, value=10.0,
+                    step=0.125, key="f_uca_len",
+                    help="Length of the upper control arm from inner pivot (frame) to outer ball joint (spindle)")
+            with f2:
+                f_lca_inner_h = st.number_input("LCA Inner Height (in)", value=6.0,
+                    step=0.125, key="f_lca_inner_h",
+                    help="Height of the LCA frame-side pivot point measured from the ground")
+                f_lca_outer_h = st.number_input("LCA Outer Height (in)", value=5.5,
+                    step=0.125, key="f_lca_outer_h",
+                    help="Height of the LCA spindle-side ball joint measured from the ground")
+            with f3:
+                f_uca_inner_h = st.number_input("UCA Inner Height (in)", value=14.0,
+                    step=0.125, key="f_uca_inner_h",
+                    help="Height of the UCA frame-side pivot point measured from the ground")
+                f_uca_outer_h = st.number_input("UCA Outer Height (in)", value=13.0,
+                    step=0.125, key="f_uca_outer_h",
+                    help="Height of the UCA spindle-side ball joint measured from the ground")
+            f_spindle_h = st.number_input(
+                "Front Track Half-Width / Spindle Offset (in)",
+                min_value=1.0, value=30.0, step=0.5, key="f_spindle_h",
+                help="Half the front track width. Distance from car centreline to the centre of the tire contact patch.")
+            st.divider()
+            st.markdown("### Rear Suspension")
+            st.caption("Trailing Arms + Upper Link")
+            r1, r2, r3 = st.columns(3)
+            with r1:
+                st.markdown("**Trailing Arms**")
+                r_ta_length = st.number_input("Trailing Arm Length (in)", min_value=0.0,
+                    value=28.0, step=0.25, key="r_ta_len",
+                    help="Length of trailing arm from frame pivot to axle mount")
+                r_ta_frame_h = st.number_input("Frame Mount Height (in)", value=8.0,
+                    step=0.25, key="r_ta_frame_h",
+                    help="Height of trailing arm frame pivot from ground")
+                r_ta_axle_h = st.number_input("Axle Mount Height (in)", value=8.0,
+                    step=0.25, key="r_ta_axle_h",
+                    help="Height of trailing arm mount on axle housing from ground")
+            with r2:
+                st.markdown("**Upper Link**")
+                r_ul_length = st.number_input("Upper Link Length (in)", min_value=0.0,
+                    value=12.0, step=0.25, key="r_ul_len",
+                    help="Length of the upper link / 3rd link / pull bar")
+                r_ul_frame_h = st.number_input("Frame Mount Height (in)", value=18.0,
+                    step=0.25, key="r_ul_frame_h",
+                    help="Height of upper link chassis-side mount from ground")
+                r_ul_axle_h = st.number_input("Axle Mount Height (in)", value=16.0,
+                    step=0.25, key="r_ul_axle_h",
+                    help="Height of upper link axle-side mount from ground")
+            with r3:
+                st.markdown("**Lateral Position**")
+                r_ul_frame_offset = st.number_input(
+                    "Frame Mount Offset from CL (in)", value=2.0, step=0.25,
+                    key="r_ul_frame_x",
+                    help="Lateral distance of chassis mount from car centreline")
+                r_ul_axle_offset = st.number_input(
+                    "Axle Mount Offset from CL (in)", value=6.0, step=0.25,
+                    key="r_ul_axle_x",
+                    help="Lateral distance of axle mount from car centreline")
+                r_track_half = st.number_input("Rear Track Half-Width (in)",
+                    min_value=1.0, value=30.0, step=0.5, key="r_half_track",
+                    help="Half the rear track width")
+            sb1, sb2 = st.columns(2)
+            with sb1:
+                st.form_submit_button("Calculate", use_container_width=True)
+            with sb2:
+                save_clicked = st.form_submit_button("Save to Log", type="primary",
+                                                     use_container_width=True)
         front_rc = _calc_front_rc_height(
             f_lca_len, f_uca_len, f_lca_inner_h, f_lca_outer_h,
             f_uca_inner_h, f_uca_outer_h, f_spindle_h)
-        st.divider()
-        st.markdown("### Rear Suspension")
-        st.caption("Trailing Arms + Upper Link")
-        r1, r2, r3 = st.columns(3)
-        with r1:
-            st.markdown("**Trailing Arms**")
-            r_ta_length = st.number_input("Trailing Arm Length (in)", min_value=0.0,
-                value=28.0, step=0.25, key="r_ta_len",
-                help="Length of trailing arm from frame pivot to axle mount")
-            r_ta_frame_h = st.number_input("Frame Mount Height (in)", value=8.0,
-                step=0.25, key="r_ta_frame_h",
-                help="Height of trailing arm frame pivot from ground")
-            r_ta_axle_h = st.number_input("Axle Mount Height (in)", value=8.0,
-                step=0.25, key="r_ta_axle_h",
-                help="Height of trailing arm mount on axle housing from ground")
-        with r2:
-            st.markdown("**Upper Link**")
-            r_ul_length = st.number_input("Upper Link Length (in)", min_value=0.0,
-                value=12.0, step=0.25, key="r_ul_len",
-                help="Length of the upper link / 3rd link / pull bar")
-            r_ul_frame_h = st.number_input("Frame Mount Height (in)", value=18.0,
-                step=0.25, key="r_ul_frame_h",
-                help="Height of upper link chassis-side mount from ground")
-            r_ul_axle_h = st.number_input("Axle Mount Height (in)", value=16.0,
-                step=0.25, key="r_ul_axle_h",
-                help="Height of upper link axle-side mount from ground")
-        with r3:
-            st.markdown("**Lateral Position**")
-            r_ul_frame_offset = st.number_input(
-                "Frame Mount Offset from CL (in)", value=2.0, step=0.25,
-                key="r_ul_frame_x",
-                help="Lateral distance of chassis mount from car centreline")
-            r_ul_axle_offset = st.number_input(
-                "Axle Mount Offset from CL (in)", value=6.0, step=0.25,
-                key="r_ul_axle_x",
-                help="Lateral distance of axle mount from car centreline")
-            r_track_half = st.number_input("Rear Track Half-Width (in)",
-                min_value=1.0, value=30.0, step=0.5, key="r_half_track",
-                help="Half the rear track width")
         rear_rc = _calc_rear_rc_height(
             r_ul_frame_h, r_ul_axle_h, r_ul_frame_offset, r_ul_axle_offset)
         st.divider()
         rc_diff = round(rear_rc - front_rc, 3)
+        if save_clicked:
+            # Same order as ALL_HEADERS
+            values = (
+                chassis, date_val, track, notes,
+                f_lca_len, f_uca_len,
+                f_lca_inner_h, f_lca_outer_h,
+                f_uca_inner_h, f_uca_outer_h,
+                f_spindle_h,
+                r_ta_length, r_ta_frame_h, r_ta_axle_h,
+                r_ul_length, r_ul_frame_h, r_ul_axle_h,
+                r_ul_frame_offset, r_ul_axle_offset,
+                r_track_half,
+                front_rc, rear_rc, rc_diff,
+            )
+            headers = _ensure_headers_once()
+            if headers[:len(ALL_HEADERS)] != ALL_HEADERS:
+                # Older sheet with a different column order -- map by name
+                by_name = dict(zip(ALL_HEADERS, values))
+                values = [by_name.get(h, "") for h in headers]
+            append_row_values("roll_centres", values)
+            st.success(f"Saved! Front RC: {front_rc:.3f} in | Rear RC: {rear_rc:.3f} in")
+            st.rerun()
         st.markdown("### Calculated Roll Centre Heights")
         res1, res2, res3 = st.columns(3)
         with res1:
@@ -863,9 +1022,9 @@ def render():
         # -- Side-view diagram --
         st.divider()
         st.markdown("### Roll Centre Diagram")
-        fig = _draw_rc_diagram(front_rc, rear_rc,
-                              roll_deg=roll_deg, dive_deg=dive_deg, wheelbase=v_wheelbase, cg_height=v_cg_height)
-        st.pyplot(fig); plt.close(fig)
+        st.image(_rc_diagram_png(front_rc, rear_rc,
+                                 roll_deg=roll_deg, dive_deg=dive_deg, wheelbase=v_wheelbase, cg_height=v_cg_height),
+                 use_column_width=True)
         # -- Front-view diagram (with roll) --
         st.divider()
         st.markdown("### Front View \u2014 Instant Centre & FVSA")
@@ -878,11 +1037,11 @@ def render():
             min_value=-3.0, max_value=3.0, value=0.0, step=0.125,
             key="fv_bump",
             help="Positive = bump (compression). Negative = droop (extension).")
-        fig_fv, geo_r, geo_l = _draw_front_view_rc(
+        png_fv, geo_r, geo_l = _front_view_png(
             f_lca_len, f_uca_len, f_lca_inner_h, f_lca_outer_h,
             f_uca_inner_h, f_uca_outer_h, f_spindle_h, front_rc,
             bump_in=bump_in, roll_deg=roll_deg)
-        st.pyplot(fig_fv); plt.close(fig_fv)
+        st.image(png_fv, use_column_width=True)
         # Live metrics
         if abs(roll_deg) > 0.01:
             st.markdown("##### Right Side")
@@ -948,36 +1107,6 @@ def render():
             with m4:
                 st.metric("Camber Angle", f"{geo_r['camber']:.3f} deg",
                     help="Camber angle at the current bump/droop position.")
-        # -- Save --
-        st.divider()
-        notes = st.text_area("Notes", key="rc_notes",
-                            placeholder="Setup notes, track conditions, etc.")
-        if st.button("Save to Log", type="primary", use_container_width=True):
-            row = {
-                "chassis": chassis, "date": date_val, "track": track,
-                "notes": notes,
-                "f_lca_length": f_lca_len, "f_uca_length": f_uca_len,
-                "f_lca_inner_height": f_lca_inner_h,
-                "f_lca_outer_height": f_lca_outer_h,
-                "f_uca_inner_height": f_uca_inner_h,
-                "f_uca_outer_height": f_uca_outer_h,
-                "f_spindle_height": f_spindle_h,
-                "r_trailing_arm_length": r_ta_length,
-                "r_trailing_arm_frame_height": r_ta_frame_h,
-                "r_trailing_arm_axle_height": r_ta_axle_h,
-                "r_upper_link_length": r_ul_length,
-                "r_upper_link_frame_height": r_ul_frame_h,
-                "r_upper_link_axle_height": r_ul_axle_h,
-                "r_upper_link_frame_offset": r_ul_frame_offset,
-                "r_upper_link_axle_offset": r_ul_axle_offset,
-                "r_rear_track_half": r_track_half,
-                "front_rc_height": front_rc,
-                "rear_rc_height": rear_rc,
-                "rc_height_diff": rc_diff,
-            }
-            append_row("roll_centres", row)
-            st.success(f"Saved! Front RC: {front_rc:.3f} in | Rear RC: {rear_rc:.3f} in")
-            st.rerun()
     # ================================================================
     # SPRING RATES TAB
     # ================================================================
@@ -1087,7 +1216,7 @@ def render():
         with cc1:
             st.dataframe(df_camber, use_container_width=True, hide_index=True)
         with cc2:
-            fig_cg, ax_cg = plt.subplots(figsize=(5, 4))
+            fig_cg, ax_cg = _subplots(figsize=(5, 4))
             fig_cg.patch.set_facecolor("#0e1117")
             ax_cg.set_facecolor("#1a1e2e")
             tvls = [d[0] for d in camber_data]
@@ -1104,8 +1233,8 @@ def render():
             ax_cg.tick_params(colors="#e0e0e0", labelsize=7)
             for spine in ax_cg.spines.values():
                 spine.set_color("#2a2e3a")
-            plt.tight_layout()
-            st.pyplot(fig_cg); plt.close(fig_cg)
+            fig_cg.tight_layout()
+            st.image(_fig_png(fig_cg), use_column_width=True)
         st.caption("Negative camber change in bump (compression) is typical "
                    "and desirable for cornering grip. This is an approximation "
                    "based on the arm geometry.")
@@ -1132,9 +1261,9 @@ def render():
             sw_lca_len, sw_uca_len, sw_lca_inner, sw_lca_outer,
             sw_uca_inner, sw_uca_outer, sw_spindle,
             travel_range=sw_range, steps=25)
-        fig_sw = _draw_sweep_chart(travels, rc_heights,
-                                  fvsa_lengths, camber_changes)
-        st.pyplot(fig_sw); plt.close(fig_sw)
+        st.image(_sweep_chart_png(travels, rc_heights,
+                                  fvsa_lengths, camber_changes),
+                 use_column_width=True)
         st.divider()
         st.markdown("##### Values at Static (0 travel)")
         mid_idx = len(travels) // 2
@@ -1178,7 +1307,7 @@ def render():
         st.subheader("Compare Saved Setups")
         st.markdown("Select two saved log entries to compare their geometry "
                     "and roll centre values side by side.")
-        df_all = read_sheet("roll_centres")
+        df_all = df_log
         if df_all.empty:
             st.info("No saved entries to compare. Save some setups first.")
         else:
@@ -1188,7 +1317,6 @@ def render():
                 dt = row.get("date", "")
                 tr = row.get("track", "")
                 labels.append(f"{ch} | {dt} | {tr}")
-            df_all["_label"] = labels
             cp1, cp2 = st.columns(2)
             with cp1:
                 sel_a = st.selectbox("Setup A", range(len(labels)),
@@ -1223,8 +1351,11 @@ def render():
                 ]
                 cmp_rows = []
                 for key, label in compare_keys:
+                    # Unmeasured cells read back as NaN -- compare them as blank
                     val_a = row_a.get(key, "")
                     val_b = row_b.get(key, "")
+                    val_a = "" if pd.isna(val_a) else val_a
+                    val_b = "" if pd.isna(val_b) else val_b
                     try:
                         va = float(val_a); vb = float(val_b)
                         diff = round(vb - va, 3)
@@ -1237,14 +1368,11 @@ def render():
                     use_container_width=True, hide_index=True)
                 st.divider()
                 st.markdown("#### Visual Overlay")
-                try:
-                    frc_a = float(row_a.get("front_rc_height", 0))
-                    rrc_a = float(row_a.get("rear_rc_height", 0))
-                    frc_b = float(row_b.get("front_rc_height", 0))
-                    rrc_b = float(row_b.get("rear_rc_height", 0))
-                except (ValueError, TypeError):
-                    frc_a = rrc_a = frc_b = rrc_b = 0
-                fig_cmp, ax_cmp = plt.subplots(figsize=(10, 4))
+                # Unmeasured RC heights plot at 0, as before
+                rc_keys = ["front_rc_height", "rear_rc_height"]
+                frc_a, rrc_a = row_a.reindex(rc_keys).fillna(0.0).astype(float)
+                frc_b, rrc_b = row_b.reindex(rc_keys).fillna(0.0).astype(float)
+                fig_cmp, ax_cmp = _subplots(figsize=(10, 4))
                 fig_cmp.patch.set_facecolor("#0e1117")
                 ax_cmp.set_facecolor("#1a1e2e")
                 wb = st.session_state.get("rc_wheelbase", 108)  # wheelbase for compare overlay
@@ -1264,22 +1392,30 @@ def render():
                 ax_cmp.tick_params(colors="#e0e0e0", labelsize=7)
                 for spine in ax_cmp.spines.values():
                     spine.set_color("#2a2e3a")
-                plt.tight_layout()
-                st.pyplot(fig_cmp); plt.close(fig_cmp)
+                fig_cmp.tight_layout()
+                st.image(_fig_png(fig_cmp), use_column_width=True)
     # ================================================================
     # LOG / HISTORY TAB
     # ================================================================
     with tab_log:
         st.subheader("Roll Centre Log")
-        df = read_sheet("roll_centres")
+        df = df_log
         if df.empty:
             st.info("No roll centre entries logged yet. "
                     "Use the Calculate tab to add your first entry.")
         else:
+            # Offer the chassis that actually have log entries
+            chassis_in_log = (sorted(df["chassis"].dropna().unique().tolist())
+                              if "chassis" in df.columns else chassis_list)
             chassis_filter = st.selectbox("Filter by Chassis",
-                ["All"] + chassis_list, key="rc_log_filter")
+                ["All"] + chassis_in_log, key="rc_log_filter")
+            positions = np.arange(len(df))
             if chassis_filter != "All":
-                df = df[df["chassis"] == chassis_filter]
+                # Positional row lists per chassis from one groupby pass
+                groups = (df.groupby("chassis", sort=False).indices
+                          if "chassis" in df.columns else {})
+                positions = groups.get(chassis_filter, positions[:0])
+                df = df.iloc[positions]
             display_cols = [c for c in [
                 "chassis", "date", "track", "front_rc_height",
                 "rear_rc_height", "rc_height_diff", "notes"
@@ -1288,15 +1424,15 @@ def render():
                         hide_index=True)
             st.divider()
             st.markdown("#### Delete Entry")
-            row_nums = list(range(1, len(df) + 1))
-            del_row = st.selectbox("Select row number to delete",
-                row_nums,
-                format_func=lambda x: (
-                    f"Row {x}: "
-                    f"{df.iloc[x-1].get('chassis','') if 'chassis' in df.columns else ''}"
-                    f" - {df.iloc[x-1].get('date','') if 'date' in df.columns else ''}"
-                ), key="rc_del_row")
-            if st.button("Delete Selected Entry", key="rc_del_btn"):
-                delete_row("roll_centres", del_row + 1)
+            del_labels = tuple(
+                f"Row {i}: {ch} - {dt}" for i, (ch, dt) in enumerate(
+                    df.reindex(columns=["chassis", "date"]).fillna("").to_numpy(),
+                    start=1))
+            del_idx = st.selectbox("Select row number to delete",
+                range(len(del_labels)), format_func=del_labels.__getitem__,
+                key="rc_del_row")
+            if del_idx is not None and st.button("Delete Selected Entry", key="rc_del_btn"):
+                # positions index the unfiltered log; +2 for header row and 1-basing
+                delete_row("roll_centres", int(positions[del_idx]) + 2)
                 st.success("Entry deleted.")
                 st.rerun()